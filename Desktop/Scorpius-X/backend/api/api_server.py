@@ -16,7 +16,7 @@ async def scan_contract(contract_address: str):
     Returns {"job_id": "<uuid>"}.
     """
     try:
-        job_id = engine.submit_scan(contract_address)
+        job_id = await engine.submit_scan(contract_address)
         return JSONResponse({"job_id": job_id})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
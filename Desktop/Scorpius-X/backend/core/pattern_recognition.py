@@ -9,6 +9,8 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import time
 from collections import defaultdict, deque
+from itertools import islice
+from operator import itemgetter
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,24 @@ class Pattern:
     profit_potential: float
     metadata: Dict[str, Any]
 
+def _new_pattern(
+    pattern_id: str,
+    pattern_type: str,
+    confidence: float,
+    frequency: int,
+    profit_potential: float,
+    metadata: Dict[str, Any],
+) -> Pattern:
+    """Build a Pattern from trusted fields, skipping the generated __init__."""
+    pattern = Pattern.__new__(Pattern)
+    pattern.pattern_id = pattern_id
+    pattern.pattern_type = pattern_type
+    pattern.confidence = confidence
+    pattern.frequency = frequency
+    pattern.profit_potential = profit_potential
+    pattern.metadata = metadata
+    return pattern
+
 class MEVPatternRecognizer:
     """
     Advanced pattern recognition for MEV opportunities.
@@ -39,6 +59,7 @@ class MEVPatternRecognizer:
         self.patterns_detected = 0
         self.pattern_history = deque(maxlen=1000)  # Store last 1000 patterns
         self.pattern_stats = defaultdict(lambda: {"count": 0, "total_profit": 0.0})
+        self._pattern_seq = 0  # Keeps pattern IDs unique within a single timestamp
         
         # Pattern detection parameters
         self.time_window_seconds = config.get("time_window_seconds", 300)  # 5 minutes
@@ -58,18 +79,19 @@ class MEVPatternRecognizer:
             List of detected patterns
         """
         patterns = []
+        now = time.time()
         
         try:
             # Analyze arbitrage patterns
-            arbitrage_patterns = await self._analyze_arbitrage_patterns(historical_data)
+            arbitrage_patterns = await self._analyze_arbitrage_patterns(historical_data, now)
             patterns.extend(arbitrage_patterns)
             
             # Analyze timing patterns  
-            timing_patterns = await self._analyze_timing_patterns(historical_data)
+            timing_patterns = await self._analyze_timing_patterns(historical_data, now)
             patterns.extend(timing_patterns)
             
             # Analyze market correlation patterns
-            correlation_patterns = await self._analyze_correlation_patterns(historical_data)
+            correlation_patterns = await self._analyze_correlation_patterns(historical_data, now)
             patterns.extend(correlation_patterns)
             
             self.patterns_detected += len(patterns)
@@ -77,7 +99,7 @@ class MEVPatternRecognizer:
             # Update pattern history
             for pattern in patterns:
                 self.pattern_history.append({
-                    "timestamp": time.time(),
+                    "timestamp": now,
                     "pattern": pattern,
                     "data_size": len(historical_data)
                 })
@@ -90,7 +112,12 @@ class MEVPatternRecognizer:
             logger.error(f"Error analyzing patterns: {e}")
             return []
     
-    async def _analyze_arbitrage_patterns(self, data: List[Dict[str, Any]]) -> List[Pattern]:
+    def _next_pattern_id(self, prefix: str, now: float) -> str:
+        """Build a unique pattern ID from a shared timestamp and a sequence counter."""
+        self._pattern_seq += 1
+        return f"{prefix}_{int(now)}_{self._pattern_seq}"
+    
+    async def _analyze_arbitrage_patterns(self, data: List[Dict[str, Any]], now: float) -> List[Pattern]:
         """Analyze arbitrage opportunity patterns."""
         patterns = []
         
@@ -106,8 +133,8 @@ class MEVPatternRecognizer:
             if len(opportunities) >= self.min_pattern_frequency:
                 avg_profit = sum(opp.get("profit_usd", 0) for opp in opportunities) / len(opportunities)
                 
-                pattern = Pattern(
-                    pattern_id=f"arbitrage_{tokens[0]}_{tokens[1]}_{int(time.time())}",
+                pattern = _new_pattern(
+                    pattern_id=self._next_pattern_id(f"arbitrage_{tokens[0]}_{tokens[1]}", now),
                     pattern_type="arbitrage",
                     confidence=min(len(opportunities) / 10.0, 1.0),  # More frequent = higher confidence
                     frequency=len(opportunities),
@@ -123,7 +150,7 @@ class MEVPatternRecognizer:
         
         return patterns
     
-    async def _analyze_timing_patterns(self, data: List[Dict[str, Any]]) -> List[Pattern]:
+    async def _analyze_timing_patterns(self, data: List[Dict[str, Any]], now: float) -> List[Pattern]:
         """Analyze timing-based patterns."""
         patterns = []
         
@@ -131,7 +158,7 @@ class MEVPatternRecognizer:
         hourly_stats = defaultdict(lambda: {"count": 0, "total_profit": 0.0})
         
         for opportunity in data:
-            timestamp = opportunity.get("timestamp", time.time())
+            timestamp = opportunity.get("timestamp", now)
             hour = int(time.gmtime(timestamp).tm_hour)
             hourly_stats[hour]["count"] += 1
             hourly_stats[hour]["total_profit"] += opportunity.get("profit_usd", 0)
@@ -145,11 +172,10 @@ class MEVPatternRecognizer:
                     best_hours.append((hour, stats, avg_profit))
         
         if best_hours:
-            best_hours.sort(key=lambda x: x[2], reverse=True)  # Sort by avg profit
-            top_hour, stats, avg_profit = best_hours[0]
+            top_hour, stats, avg_profit = max(best_hours, key=itemgetter(2))  # Highest avg profit
             
             pattern = Pattern(
-                pattern_id=f"timing_hour_{top_hour}_{int(time.time())}",
+                pattern_id=self._next_pattern_id(f"timing_hour_{top_hour}", now),
                 pattern_type="timing",
                 confidence=min(stats["count"] / 20.0, 1.0),
                 frequency=stats["count"],
@@ -157,15 +183,14 @@ class MEVPatternRecognizer:
                 metadata={
                     "peak_hour": top_hour,
                     "avg_profit": avg_profit,
-                    "frequency": stats["count"],
-                    "all_hour_stats": dict(hourly_stats)
+                    "frequency": stats["count"]
                 }
             )
             patterns.append(pattern)
         
         return patterns
     
-    async def _analyze_correlation_patterns(self, data: List[Dict[str, Any]]) -> List[Pattern]:
+    async def _analyze_correlation_patterns(self, data: List[Dict[str, Any]], now: float) -> List[Pattern]:
         """Analyze market correlation patterns."""
         patterns = []
         
@@ -193,7 +218,7 @@ class MEVPatternRecognizer:
                 
                 if high_gas_avg > low_gas_avg * 1.2:  # 20% higher profit for higher gas
                     pattern = Pattern(
-                        pattern_id=f"gas_correlation_{int(time.time())}",
+                        pattern_id=self._next_pattern_id("gas_correlation", now),
                         pattern_type="correlation",
                         confidence=0.8,
                         frequency=len(gas_profit_correlation),
@@ -223,7 +248,8 @@ class MEVPatternRecognizer:
             predictions = []
             
             # Check against known patterns
-            for pattern_entry in list(self.pattern_history)[-50:]:  # Check last 50 patterns
+            start = max(len(self.pattern_history) - 50, 0)
+            for pattern_entry in islice(self.pattern_history, start, None):  # Check last 50 patterns
                 pattern = pattern_entry["pattern"]
                 
                 # Simple pattern matching based on conditions
@@ -250,7 +276,7 @@ class MEVPatternRecognizer:
             
             # Return best prediction if any
             if predictions:
-                best_prediction = max(predictions, key=lambda x: x["confidence"])
+                best_prediction = max(predictions, key=itemgetter("confidence"))
                 if best_prediction["confidence"] >= self.confidence_threshold:
                     return best_prediction
             
@@ -3,12 +3,17 @@ Scorpius AI-Powered Vulnerability Analyzer
 Advanced smart contract analysis using Claude AI
 """
 import asyncio
+import hashlib
 import json
 import logging
+import random
+import re
 import time
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import asdict
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import aiohttp
+import orjson
 import os
 from models.scorpius_models import (
     VulnerabilityFinding, VulnerabilityType, VulnerabilityLevel,
@@ -17,26 +22,544 @@ from models.scorpius_models import (
 
 logger = logging.getLogger(__name__)
 
+# Response cache limits for repeated analyses of the same contract input
+RESPONSE_CACHE_MAX_SIZE = 2048
+RESPONSE_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+ANALYSIS_FAILED_ASSESSMENT = "Analysis failed"
+PARSE_FAILED_ASSESSMENT = "Analysis parsing failed"
+
+# Model routing: try the fast model first and escalate uncertain results
+CLAUDE_FAST_MODEL = os.getenv("CLAUDE_FAST_MODEL", "claude-3-5-haiku-latest")
+CLAUDE_DEEP_MODEL = os.getenv("CLAUDE_DEEP_MODEL", "claude-3-5-sonnet-latest")
+FAST_MODEL_MAX_TOKENS = 1500
+ESCALATION_ANALYSIS_CONFIDENCE = 0.6
+ESCALATION_FINDING_CONFIDENCE = 0.7
+
+# Rough output budget per contract, used to size batched requests
+BATCH_TOKENS_PER_CONTRACT = 1000
+
+# Maximum Claude requests in flight across all analyzers
+CLAUDE_CONCURRENCY = int(os.getenv("CLAUDE_CONCURRENCY", "8"))
+
+# Client-side request rate and retry policy for rate limits / server errors
+CLAUDE_REQUESTS_PER_MINUTE = int(os.getenv("CLAUDE_REQUESTS_PER_MINUTE", "50"))
+CLAUDE_MAX_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 60.0
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504, 529})
+
+# Per-phase HTTP timeouts; sock_read bounds the gap between streamed chunks, so
+# a long generation is not cut off while a stalled handshake still fails fast.
+# The overall deadline covers every retry of one analysis call.
+CLAUDE_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=5, sock_connect=5, sock_read=55)
+CLAUDE_REQUEST_TIMEOUT_SECONDS = float(os.getenv("CLAUDE_REQUEST_TIMEOUT_SECONDS", "300"))
+
+# Static prompt sections. These must stay byte-identical across calls so the
+# Anthropic prompt cache can reuse them; per-contract data goes after them.
+STATIC_HEADER = """You are Scorpius, the world's most advanced smart contract security analyzer. Analyze this Ethereum contract for vulnerabilities with extreme precision.
+"""
+
+STATIC_TAXONOMY = """
+ADVANCED VULNERABILITY PATTERNS TO DETECT:
+1. **Supply Chain Library Compromise** - Check for malicious library dependencies
+2. **Advanced Persistent Smart Contract Threats** - Hidden backdoors with time delays
+3. **Race Condition Exploits** - Payment processing duplication vulnerabilities
+4. **Multi-Signature Wallet Library Dependencies** - Shared library destruction risks
+5. **Advanced Oracle Manipulation** - Infrastructure targeting beyond price feeds
+6. **Proxy Contract Tampering** - Upgradeable contract exploitation
+7. **Cross-Function Reentrancy** - Complex entrypoint vulnerabilities
+8. **Cross-Chain Verification Exploits** - Bridge protocol vulnerabilities
+9. **Delegatecall Exploitation** - Malicious logic injection
+10. **Access Control Bypass** - Admin privilege escalation
+11. **Flash Loan Attacks** - Price manipulation and arbitrage
+12. **MEV Vulnerabilities** - Sandwich attacks and front-running
+13. **Upgrade Mechanism Flaws** - Implementation swap attacks
+14. **Storage Collision** - Proxy storage layout conflicts
+15. **Signature Replay** - Cross-chain signature reuse
+"""
+
+STATIC_OUTPUT_SCHEMA = """
+ANALYSIS REQUIREMENTS:
+1. **Identify ALL vulnerabilities** with exact function names and line numbers
+2. **Generate working exploit code** for each vulnerability found
+3. **Assess business impact** in dollar terms where possible
+4. **Provide specific mitigation steps** for each issue
+5. **Rate exploitation complexity** (Trivial/Easy/Medium/Hard/Expert)
+6. **Calculate confidence scores** (0.0-1.0) for each finding
+
+OUTPUT FORMAT (JSON):
+{
+  "vulnerabilities": [
+    {
+      "vuln_type": "backdoor|reentrancy|access_control|proxy_tampering|oracle_manipulation|cross_chain_exploit|supply_chain_attack|race_condition|library_dependency|upgrade_vulnerability|delegatecall_exploit|flash_loan_attack|sandwich_attack|mev_vulnerability|admin_privilege_abuse",
+      "severity": "critical|high|medium|low|info",
+      "title": "Precise vulnerability title",
+      "description": "Detailed technical description",
+      "function_name": "vulnerable_function_name",
+      "function_signature": "function(uint256,address)",
+      "line_number": 123,
+      "code_snippet": "Exact vulnerable code",
+      "exploit_code": "Working exploit in Solidity/JavaScript",
+      "mitigation": "Specific fix instructions",
+      "references": ["CVE-2023-xxxx", "https://example.com"],
+      "confidence": 0.95,
+      "ai_analysis": "Detailed reasoning for this finding"
+    }
+  ],
+  "analysis": {
+    "confidence_score": 0.92,
+    "risk_assessment": "CRITICAL - Contract has multiple high-severity vulnerabilities",
+    "attack_vectors": ["Direct exploitation", "Flash loan manipulation"],
+    "exploitation_complexity": "Easy",
+    "business_impact": "Potential loss of $X million in user funds",
+    "recommendations": [
+      "Implement reentrancy guards",
+      "Add proper access controls"
+    ],
+    "ai_reasoning": "Detailed analysis of contract security posture"
+  }
+}
+
+BE EXTREMELY THOROUGH. This is for enterprise security - accuracy is critical.
+The contract to analyze follows.
+"""
+
+# A single cache breakpoint on the last static block caches the whole prefix
+STATIC_PROMPT_BLOCKS = (
+    {"type": "text", "text": STATIC_HEADER},
+    {"type": "text", "text": STATIC_TAXONOMY},
+    {"type": "text", "text": STATIC_OUTPUT_SCHEMA, "cache_control": {"type": "ephemeral"}},
+)
+
+# Input must leave room for the response plus a safety margin
+CLAUDE_CONTEXT_WINDOW_TOKENS = 200000
+PROMPT_SAFETY_MARGIN_TOKENS = 512
+
+BATCH_INSTRUCTIONS = """BATCH MODE: {count} contracts follow, each under a "### CONTRACT <n> ###" header.
+Analyze each contract independently and respond with a single JSON object:
+{{"results": [<one OUTPUT FORMAT object per contract, in the same order>]}}
+"""
+
+
+# Prompt budgets for per-contract code. Token counts use a ~4 chars/token estimate.
+SOURCE_TOKEN_BUDGET = 2000
+BYTECODE_CHAR_BUDGET = 2000
+CONTEXT_CHAR_BUDGET = 2000
+
+# Prior findings are ranked by severity when the context has to be trimmed
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+LOW_SEVERITIES = frozenset({"low", "info"})
+
+# Keywords that mark a Solidity function as security-relevant, with weights
+RISK_KEYWORDS = {
+    "delegatecall": 5,
+    "selfdestruct": 5,
+    "assembly": 4,
+    "call{": 4,
+    ".call(": 4,
+    "tx.origin": 4,
+    "ecrecover": 3,
+    "upgradeTo": 3,
+    "transferFrom": 2,
+    "transfer(": 2,
+    "send(": 2,
+    "onlyOwner": 2,
+    "owner": 1,
+    "block.timestamp": 1,
+    "approve": 1,
+    "mint": 1,
+    "withdraw": 2,
+}
+
+# Enum lookups for parsed findings; unknown values fall back to the defaults
+VULN_TYPE_MAP = {member.value: member for member in VulnerabilityType}
+VULN_LEVEL_MAP = {member.value: member for member in VulnerabilityLevel}
+
+# Only a keyword followed by a name or parameter list starts a declaration
+FUNCTION_START_RE = re.compile(r"\b(?:function|constructor|modifier|fallback|receive)\b(?=\s*[A-Za-z_$(])")
+# Comments and string literals, blanked out before scanning for functions and braces
+SOLIDITY_TRIVIA_RE = re.compile(
+    r"//[^\n]*|/\*.*?(?:\*/|\Z)|\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'",
+    re.S
+)
+
+
+def find_object_end(text: str, start: int) -> int:
+    """
+    Return the offset just past the JSON object opening at text[start]
+    
+    Single pass tracking brace depth, ignoring braces inside string literals.
+    Returns -1 if the object is not closed.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+# Estimated once at import; the static prefix never changes between calls
+STATIC_PROMPT_TOKENS = sum(estimate_tokens(block["text"]) for block in STATIC_PROMPT_BLOCKS)
+
+
+def _blank_trivia(src: str) -> str:
+    """Replace comments and string literals with spaces, keeping every offset"""
+    return SOLIDITY_TRIVIA_RE.sub(lambda match: " " * len(match.group()), src)
+
+
+def _find_function_spans(src: str) -> List[Tuple[int, int]]:
+    """Return (start, end) offsets of each function/modifier body in Solidity source"""
+    # Scan a copy without comments/strings so neither keywords nor braces inside
+    # them are matched; offsets are unchanged, so spans index the original
+    src = _blank_trivia(src)
+    spans = []
+    pos = 0
+    while True:
+        match = FUNCTION_START_RE.search(src, pos)
+        if not match:
+            return spans
+        start = match.start()
+        body = src.find("{", match.end())
+        terminator = src.find(";", match.end())
+        if body == -1 or (terminator != -1 and terminator < body):
+            # Declaration without a body (interface / abstract)
+            pos = match.end() if terminator == -1 else terminator + 1
+            continue
+        depth = 0
+        end = len(src)
+        for i in range(body, len(src)):
+            char = src[i]
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    end = i + 1
+                    break
+        spans.append((start, end))
+        pos = end
+
+
+@lru_cache(maxsize=256)
+def compress_source(src: str, budget_tokens: int = SOURCE_TOKEN_BUDGET) -> str:
+    """
+    Shrink Solidity source to a token budget, keeping the riskiest functions
+    
+    Declarations outside functions (pragmas, contract headers, state variables,
+    events) are kept first; functions are then added in order of risk keyword
+    score until the budget is spent, and emitted in their original order.
+    """
+    if estimate_tokens(src) <= budget_tokens:
+        return src
+    
+    spans = _find_function_spans(src)
+    if not spans:
+        return src[:budget_tokens * 4]
+    
+    # Text between functions (pragmas, contract headers, state, events) is always kept
+    gaps = []
+    previous_end = 0
+    for start, end in spans:
+        gaps.append(src[previous_end:start])
+        previous_end = end
+    gaps.append(src[previous_end:])
+    
+    prefix = src[:budget_tokens * 4]
+    # Whitespace-only gaps between adjacent functions cost (next to) nothing
+    remaining = budget_tokens - sum(estimate_tokens(gap) for gap in gaps if gap.strip())
+    if remaining <= 0:
+        return prefix
+    
+    scored = []
+    for index, (start, end) in enumerate(spans):
+        text = src[start:end]
+        score = sum(weight * text.count(keyword) for keyword, weight in RISK_KEYWORDS.items())
+        scored.append((-score, index, estimate_tokens(text)))
+    scored.sort()
+    
+    kept = set()
+    for _, index, cost in scored:
+        if cost <= remaining:
+            kept.add(index)
+            remaining -= cost
+    
+    # Emit in original order, collapsing runs of dropped functions into a marker
+    parts = [gaps[0]]
+    omitted = 0
+    for index, (start, end) in enumerate(spans):
+        if index in kept:
+            if omitted:
+                parts.append(f"// ... {omitted} lower-risk functions omitted\n")
+                omitted = 0
+            parts.append(src[start:end])
+        else:
+            omitted += 1
+        gap = gaps[index + 1]
+        if index in kept or gap.strip():
+            if omitted:
+                parts.append(f"// ... {omitted} lower-risk functions omitted\n")
+                omitted = 0
+            parts.append(gap)
+    if omitted:
+        parts.append(f"// ... {omitted} lower-risk functions omitted\n")
+    compressed = "".join(parts)
+    # A plain prefix is better than a selection that keeps less of the contract
+    return compressed if len(compressed) >= len(prefix) else prefix
+
+
+@lru_cache(maxsize=256)
+def compress_bytecode(bytecode: str, budget_chars: int = BYTECODE_CHAR_BUDGET) -> str:
+    """
+    Shrink hex bytecode to a budget by dropping duplicate basic blocks
+    
+    Blocks are split at JUMPDEST (0x5b) boundaries, skipping PUSH immediates,
+    and kept in original order until the budget is reached.
+    """
+    code = bytecode[2:] if bytecode.startswith("0x") else bytecode
+    if len(code) <= budget_chars:
+        return bytecode
+    
+    try:
+        raw = bytes.fromhex(code)
+    except ValueError:
+        return bytecode[:budget_chars]
+    
+    blocks = []
+    block_start = 0
+    i = 0
+    while i < len(raw):
+        opcode = raw[i]
+        if opcode == 0x5B and i != block_start:
+            blocks.append(raw[block_start:i])
+            block_start = i
+        # PUSH1..PUSH32 carry 1..32 bytes of immediate data
+        i += 1 + (opcode - 0x5F if 0x60 <= opcode <= 0x7F else 0)
+    blocks.append(raw[block_start:])
+    
+    seen = set()
+    parts = []
+    used = 2
+    for block in blocks:
+        if block in seen:
+            continue
+        seen.add(block)
+        hex_block = block.hex()
+        if used + len(hex_block) > budget_chars:
+            break
+        parts.append(hex_block)
+        used += len(hex_block)
+    return "0x" + "".join(parts)
+
+
+def _context_severity(item: Any) -> str:
+    severity = item.get("severity") if isinstance(item, dict) else None
+    return severity.lower() if isinstance(severity, str) else "medium"
+
+
+def _dumps_sorted(value: Any, options: int = orjson.OPT_SORT_KEYS) -> str:
+    """
+    Serialize with sorted keys, falling back to the stdlib json module for
+    values orjson rejects (integers beyond 64 bits, e.g. raw wei amounts)
+    """
+    try:
+        return orjson.dumps(value, option=options, default=str).decode()
+    except orjson.JSONEncodeError:
+        indent = 2 if options & orjson.OPT_INDENT_2 else None
+        return json.dumps(value, sort_keys=True, indent=indent, default=str)
+
+
+def _shrink_finding(item: Any, budget_chars: int, options: int) -> str:
+    """
+    Serialize a single finding as a one-element list within budget_chars
+    
+    Long string fields are cut (marked with "...") until it fits; failing
+    that, a short summary object stands in for the finding. Either way the
+    result is valid JSON.
+    """
+    if isinstance(item, dict):
+        limit = budget_chars
+        while limit >= 16:
+            shrunk = {
+                key: value[:limit] + "..." if isinstance(value, str) and len(value) > limit else value
+                for key, value in item.items()
+            }
+            serialized = _dumps_sorted([shrunk], options)
+            if len(serialized) <= budget_chars:
+                return serialized
+            limit //= 2
+    title = item.get("title") if isinstance(item, dict) else None
+    summary = {"severity": _context_severity(item), "truncated": True}
+    if isinstance(title, str):
+        summary["title"] = title[:80]
+    return orjson.dumps([summary], option=options).decode()
+
+
+def format_vulnerability_context(
+    vulnerability_context: List[Dict],
+    budget_chars: int = CONTEXT_CHAR_BUDGET
+) -> str:
+    """
+    Serialize prior scan results canonically, trimming by severity to fit a budget
+    
+    Keys are sorted so the same findings always produce the same bytes. When
+    the result is over budget, low/info findings are dropped and the rest are
+    kept in severity order until the budget is reached.
+    """
+    options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+    serialized = _dumps_sorted(vulnerability_context, options)
+    if len(serialized) <= budget_chars:
+        return serialized
+    
+    ranked = sorted(
+        (item for item in vulnerability_context if _context_severity(item) not in LOW_SEVERITIES),
+        key=lambda item: SEVERITY_RANK.get(_context_severity(item), 2)
+    )
+    # Each finding is serialized once; the list is "[\n" + items joined by ",\n" + "\n]"
+    kept = []
+    total = len("[\n\n]")
+    for item in ranked:
+        item_json = _dumps_sorted(item, options)
+        added = len(item_json) + (len(",\n") if kept else 0)
+        if total + added > budget_chars:
+            break
+        kept.append(item_json)
+        total += added
+    
+    if not ranked:
+        return "[]"
+    if not kept:
+        # Even the most severe finding alone is over budget
+        return _shrink_finding(ranked[0], budget_chars, options)
+    return "[\n" + ",\n".join(kept) + "\n]"
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds"""
+    
+    def __init__(self, rate: int, period: float = 60.0):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
 
 class ClaudeAnalyzer:
     """AI-powered vulnerability analyzer using Claude"""
     
+    # Analyzers are created per scan request, so the HTTP session is shared at
+    # class level to keep connections to the API alive between scans.
+    _session: Optional[aiohttp.ClientSession] = None
+    # Shared LRU of key -> (expires_at, (vulnerabilities, analysis))
+    _response_cache: "OrderedDict[str, Tuple[float, Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]]]" = OrderedDict()
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _rate_limiter: Optional[TokenBucket] = None
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.base_url = "https://api.anthropic.com/v1/messages"
-        self.model = "claude-3-opus-20240229"
+        self.fast_model = CLAUDE_FAST_MODEL
+        self.deep_model = CLAUDE_DEEP_MODEL
+        self.model = self.deep_model
         self.max_tokens = 4000
         
+        # Request parts that do not change between calls
+        self._headers = {
+            "x-api-key": self.api_key or "",
+            "content-type": "application/json",
+            "anthropic-version": "2023-06-01",
+            "anthropic-beta": "prompt-caching-2024-07-31"
+        }
+        self._payload_skeleton = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": 0.0,  # Deterministic output so cached responses stay valid
+            "stream": True
+        }
+        
         if not self.api_key:
             logger.warning("No Anthropic API key provided - AI analysis will be disabled")
     
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared keep-alive session, creating it on first use"""
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            cls._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=CLAUDE_HTTP_TIMEOUT
+            )
+        return cls._session
+    
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        """Get the shared semaphore bounding concurrent API calls"""
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(CLAUDE_CONCURRENCY)
+        return cls._semaphore
+    
+    @classmethod
+    def _get_rate_limiter(cls) -> TokenBucket:
+        """Get the shared request rate limiter"""
+        if cls._rate_limiter is None:
+            cls._rate_limiter = TokenBucket(CLAUDE_REQUESTS_PER_MINUTE, 60.0)
+        return cls._rate_limiter
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP session"""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+    
     async def analyze_contract(
         self,
         contract_address: str,
         source_code: Optional[str] = None,
         bytecode: Optional[str] = None,
         contract_info: Optional[ContractInfo] = None,
-        vulnerability_context: Optional[List[Dict]] = None
+        vulnerability_context: Optional[List[Dict]] = None,
+        refresh: bool = False,
+        on_token: Optional[Callable[[str], None]] = None
     ) -> Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]:
         """
         Comprehensive AI analysis of smart contract
@@ -47,6 +570,8 @@ class ClaudeAnalyzer:
             bytecode: Contract bytecode
             contract_info: Contract metadata
             vulnerability_context: Previous vulnerability scan results
+            refresh: Bypass the response cache and re-run the analysis
+            on_token: Called with each text chunk as the response streams in
             
         Returns:
             Tuple of (vulnerabilities, ai_analysis)
@@ -55,6 +580,15 @@ class ClaudeAnalyzer:
             logger.warning("AI analysis skipped - no API key")
             return [], ScorpiusAnalysis()
         
+        cache_key = self._cache_key(
+            contract_address, source_code, bytecode,
+            contract_info, vulnerability_context
+        )
+        if not refresh:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             # Prepare analysis prompt
             prompt = self._build_analysis_prompt(
@@ -62,11 +596,29 @@ class ClaudeAnalyzer:
                 contract_info, vulnerability_context
             )
             
-            # Get AI analysis
-            ai_response = await self._call_claude_api(prompt)
+            # Fast model first; only uncertain results are re-run on the deep model.
+            # Its text is buffered so on_token only ever sees the response returned
+            fast_chunks: List[str] = []
+            ai_response, stop_reason = await asyncio.wait_for(
+                self._call_claude_api(prompt, fast_chunks.append, self.fast_model, FAST_MODEL_MAX_TOKENS),
+                CLAUDE_REQUEST_TIMEOUT_SECONDS
+            )
+            vulnerabilities, analysis = self._parse_ai_response(ai_response, self.fast_model)
             
-            # Parse AI response
-            vulnerabilities, analysis = self._parse_ai_response(ai_response)
+            # A response cut off at the token cap is incomplete whether or not it parses
+            if stop_reason == "max_tokens" or self._needs_escalation(vulnerabilities, analysis):
+                logger.info(f"Escalating AI analysis of {contract_address} to {self.deep_model}")
+                ai_response, _ = await asyncio.wait_for(
+                    self._call_claude_api(prompt, on_token, self.deep_model),
+                    CLAUDE_REQUEST_TIMEOUT_SECONDS
+                )
+                vulnerabilities, analysis = self._parse_ai_response(ai_response, self.deep_model)
+            elif on_token:
+                for chunk in fast_chunks:
+                    on_token(chunk)
+            
+            if analysis.risk_assessment != PARSE_FAILED_ASSESSMENT:
+                self._cache_put(cache_key, vulnerabilities, analysis)
             
             return vulnerabilities, analysis
             
@@ -75,10 +627,183 @@ class ClaudeAnalyzer:
             return [], ScorpiusAnalysis(
                 model_used=self.model,
                 confidence_score=0.0,
-                risk_assessment="Analysis failed",
+                risk_assessment=ANALYSIS_FAILED_ASSESSMENT,
                 ai_reasoning=f"Error: {str(e)}"
             )
     
+    @staticmethod
+    def _needs_escalation(
+        vulnerabilities: List[VulnerabilityFinding],
+        analysis: ScorpiusAnalysis
+    ) -> bool:
+        """Whether a fast-model result is too uncertain to keep"""
+        try:
+            if float(analysis.confidence_score) < ESCALATION_ANALYSIS_CONFIDENCE:
+                return True
+            return any(
+                float(vuln.confidence) < ESCALATION_FINDING_CONFIDENCE
+                for vuln in vulnerabilities
+            )
+        except (TypeError, ValueError):
+            return True
+    
+    async def analyze_many(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]]:
+        """
+        Analyze contracts concurrently, bounded by CLAUDE_CONCURRENCY
+        
+        Args:
+            requests: analyze_contract keyword arguments, one dict per contract
+            
+        Returns:
+            List of (vulnerabilities, ai_analysis) tuples in the order of requests
+        """
+        return await asyncio.gather(*[self.analyze_contract(**request) for request in requests])
+    
+    async def analyze_contracts_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]]:
+        """
+        Analyze several contracts, sharing one Claude call per batch
+        
+        Args:
+            items: analyze_contract keyword arguments, one dict per contract
+            
+        Returns:
+            List of (vulnerabilities, ai_analysis) tuples in the order of items
+        """
+        if not self.api_key:
+            logger.warning("AI analysis skipped - no API key")
+            return [([], ScorpiusAnalysis()) for _ in items]
+        
+        results: List[Optional[Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]]] = [None] * len(items)
+        pending = []
+        for index, item in enumerate(items):
+            cache_key = self._cache_key(
+                item["contract_address"], item.get("source_code"), item.get("bytecode"),
+                item.get("contract_info"), item.get("vulnerability_context")
+            )
+            cached = None if item.get("refresh") else self._cache_get(cache_key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, cache_key, item))
+        
+        batch_size = max(1, self.max_tokens // BATCH_TOKENS_PER_CONTRACT)
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            batch_results = await self._analyze_batch([item for _, _, item in batch])
+            for (index, cache_key, _), (vulnerabilities, analysis) in zip(batch, batch_results):
+                results[index] = (vulnerabilities, analysis)
+                if analysis.risk_assessment not in (PARSE_FAILED_ASSESSMENT, ANALYSIS_FAILED_ASSESSMENT):
+                    self._cache_put(cache_key, vulnerabilities, analysis)
+        
+        return results
+    
+    async def _analyze_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]]:
+        """Run one Claude call covering every contract in items"""
+        sections = [BATCH_INSTRUCTIONS.format(count=len(items))]
+        for number, item in enumerate(items, 1):
+            sections.append(f"\n### CONTRACT {number} ###\n")
+            sections.append(self._build_contract_section(
+                item["contract_address"], item.get("source_code"), item.get("bytecode"),
+                item.get("contract_info"), item.get("vulnerability_context")
+            ))
+        prompt = [*STATIC_PROMPT_BLOCKS, {"type": "text", "text": "".join(sections)}]
+        
+        try:
+            ai_response, _ = await asyncio.wait_for(
+                self._call_claude_api(prompt),
+                CLAUDE_REQUEST_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            logger.error(f"Batch AI analysis failed: {e}")
+            return [
+                ([], ScorpiusAnalysis(
+                    model_used=self.model,
+                    confidence_score=0.0,
+                    risk_assessment=ANALYSIS_FAILED_ASSESSMENT,
+                    ai_reasoning=f"Error: {str(e)}"
+                ))
+                for _ in items
+            ]
+        
+        try:
+            per_contract = self._extract_json(ai_response).get("results", [])
+        except Exception as e:
+            logger.error(f"Failed to parse batch AI response: {e}")
+            per_contract = []
+        
+        results = []
+        for index in range(len(items)):
+            try:
+                if index >= len(per_contract):
+                    raise ValueError("No result returned for this contract in batch response")
+                results.append(self._parse_analysis_data(per_contract[index]))
+            except Exception as e:
+                results.append(([], ScorpiusAnalysis(
+                    model_used=self.model,
+                    confidence_score=0.0,
+                    risk_assessment=PARSE_FAILED_ASSESSMENT,
+                    ai_reasoning=f"Failed to parse AI response: {str(e)}"
+                )))
+        return results
+    
+    @staticmethod
+    def _cache_key(
+        contract_address: str,
+        source_code: Optional[str],
+        bytecode: Optional[str],
+        contract_info: Optional[ContractInfo],
+        vulnerability_context: Optional[List[Dict]]
+    ) -> str:
+        """Hash every analysis input into a response cache key"""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(contract_address.lower().encode())
+        for blob in (source_code, bytecode):
+            digest.update(b"|")
+            digest.update(hashlib.sha256((blob or "").encode()).digest())
+        digest.update(b"|")
+        digest.update(_dumps_sorted(contract_info).encode())
+        digest.update(b"|")
+        digest.update(_dumps_sorted(vulnerability_context).encode())
+        return digest.hexdigest()
+    
+    @classmethod
+    def _cache_get(cls, key: str) -> Optional[Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]]:
+        """Return a cached, unexpired analysis result"""
+        entry = cls._response_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, (vulnerabilities, analysis) = entry
+        if expires_at < time.monotonic():
+            del cls._response_cache[key]
+            return None
+        cls._response_cache.move_to_end(key)
+        return list(vulnerabilities), analysis
+    
+    @classmethod
+    def _cache_put(
+        cls,
+        key: str,
+        vulnerabilities: List[VulnerabilityFinding],
+        analysis: ScorpiusAnalysis
+    ) -> None:
+        """Store an analysis result, evicting the least recently used entry"""
+        cls._response_cache[key] = (
+            time.monotonic() + RESPONSE_CACHE_TTL_SECONDS,
+            (list(vulnerabilities), analysis)
+        )
+        cls._response_cache.move_to_end(key)
+        while len(cls._response_cache) > RESPONSE_CACHE_MAX_SIZE:
+            cls._response_cache.popitem(last=False)
+    
     def _build_analysis_prompt(
         self,
         contract_address: str,
@@ -86,34 +811,41 @@ class ClaudeAnalyzer:
         bytecode: Optional[str],
         contract_info: Optional[ContractInfo],
         vulnerability_context: Optional[List[Dict]]
+    ) -> List[Dict[str, Any]]:
+        """Build analysis prompt as content blocks: cached static prefix, then per-contract data"""
+        section = self._build_contract_section(
+            contract_address, source_code, bytecode,
+            contract_info, vulnerability_context
+        )
+        return [*STATIC_PROMPT_BLOCKS, {"type": "text", "text": section}]
+    
+    def _input_token_budget(self) -> int:
+        """Estimated tokens available for the per-contract part of the prompt"""
+        return (
+            CLAUDE_CONTEXT_WINDOW_TOKENS - self.max_tokens
+            - PROMPT_SAFETY_MARGIN_TOKENS - STATIC_PROMPT_TOKENS
+        )
+    
+    def _build_contract_section(
+        self,
+        contract_address: str,
+        source_code: Optional[str],
+        bytecode: Optional[str],
+        contract_info: Optional[ContractInfo],
+        vulnerability_context: Optional[List[Dict]]
     ) -> str:
-        """Build comprehensive analysis prompt for Claude"""
+        """
+        Build the per-contract part of the prompt
         
-        prompt = f"""You are Scorpius, the world's most advanced smart contract security analyzer. Analyze this Ethereum contract for vulnerabilities with extreme precision.
-
-CONTRACT ADDRESS: {contract_address}
-
-ADVANCED VULNERABILITY PATTERNS TO DETECT:
-1. **Supply Chain Library Compromise** - Check for malicious library dependencies
-2. **Advanced Persistent Smart Contract Threats** - Hidden backdoors with time delays
-3. **Race Condition Exploits** - Payment processing duplication vulnerabilities
-4. **Multi-Signature Wallet Library Dependencies** - Shared library destruction risks
-5. **Advanced Oracle Manipulation** - Infrastructure targeting beyond price feeds
-6. **Proxy Contract Tampering** - Upgradeable contract exploitation
-7. **Cross-Function Reentrancy** - Complex entrypoint vulnerabilities
-8. **Cross-Chain Verification Exploits** - Bridge protocol vulnerabilities
-9. **Delegatecall Exploitation** - Malicious logic injection
-10. **Access Control Bypass** - Admin privilege escalation
-11. **Flash Loan Attacks** - Price manipulation and arbitrage
-12. **MEV Vulnerabilities** - Sandwich attacks and front-running
-13. **Upgrade Mechanism Flaws** - Implementation swap attacks
-14. **Storage Collision** - Proxy storage layout conflicts
-15. **Signature Replay** - Cross-chain signature reuse
-
-"""
+        Source, bytecode and prior findings are each capped by their budget
+        constant, so a section stays a few thousand tokens at most.
+        """
+        
+        parts = [f"""CONTRACT ADDRESS: {contract_address}
+"""]
 
         if contract_info:
-            prompt += f"""
+            parts.append(f"""
 CONTRACT METADATA:
 - Verified: {contract_info.verified}
 - Proxy: {contract_info.proxy}
@@ -122,130 +854,209 @@ CONTRACT METADATA:
 - Transaction Count: {contract_info.tx_count}
 - Compiler: {contract_info.compiler_version}
 - Optimization: {contract_info.optimization}
-"""
+""")
 
         if source_code:
-            prompt += f"""
+            parts.append(f"""
 SOURCE CODE ANALYSIS:
 ```solidity
-{source_code[:8000]}  # Truncate if too long
+{compress_source(source_code)}
 ```
-"""
+""")
 
         if bytecode:
-            prompt += f"""
+            parts.append(f"""
 BYTECODE ANALYSIS:
 ```
-{bytecode[:2000]}  # Truncate if too long
+{compress_bytecode(bytecode)}
 ```
-"""
+""")
 
         if vulnerability_context:
-            prompt += f"""
+            parts.append(f"""
 PREVIOUS SCAN RESULTS:
-{json.dumps(vulnerability_context, indent=2)[:2000]}
-"""
-
-        prompt += """
-ANALYSIS REQUIREMENTS:
-1. **Identify ALL vulnerabilities** with exact function names and line numbers
-2. **Generate working exploit code** for each vulnerability found
-3. **Assess business impact** in dollar terms where possible
-4. **Provide specific mitigation steps** for each issue
-5. **Rate exploitation complexity** (Trivial/Easy/Medium/Hard/Expert)
-6. **Calculate confidence scores** (0.0-1.0) for each finding
-
-OUTPUT FORMAT (JSON):
-{
-  "vulnerabilities": [
-    {
-      "vuln_type": "backdoor|reentrancy|access_control|proxy_tampering|oracle_manipulation|cross_chain_exploit|supply_chain_attack|race_condition|library_dependency|upgrade_vulnerability|delegatecall_exploit|flash_loan_attack|sandwich_attack|mev_vulnerability|admin_privilege_abuse",
-      "severity": "critical|high|medium|low|info",
-      "title": "Precise vulnerability title",
-      "description": "Detailed technical description",
-      "function_name": "vulnerable_function_name",
-      "function_signature": "function(uint256,address)",
-      "line_number": 123,
-      "code_snippet": "Exact vulnerable code",
-      "exploit_code": "Working exploit in Solidity/JavaScript",
-      "mitigation": "Specific fix instructions",
-      "references": ["CVE-2023-xxxx", "https://example.com"],
-      "confidence": 0.95,
-      "ai_analysis": "Detailed reasoning for this finding"
-    }
-  ],
-  "analysis": {
-    "confidence_score": 0.92,
-    "risk_assessment": "CRITICAL - Contract has multiple high-severity vulnerabilities",
-    "attack_vectors": ["Direct exploitation", "Flash loan manipulation"],
-    "exploitation_complexity": "Easy",
-    "business_impact": "Potential loss of $X million in user funds",
-    "recommendations": [
-      "Implement reentrancy guards",
-      "Add proper access controls"
-    ],
-    "ai_reasoning": "Detailed analysis of contract security posture"
-  }
-}
-
-BE EXTREMELY THOROUGH. This is for enterprise security - accuracy is critical.
-"""
+{format_vulnerability_context(vulnerability_context)}
+""")
         
-        return prompt
+        return "".join(parts)
     
-    async def _call_claude_api(self, prompt: str) -> str:
-        """Call Claude API for analysis"""
-        headers = {
-            "x-api-key": self.api_key,
-            "content-type": "application/json",
-            "anthropic-version": "2023-06-01"
-        }
+    async def _call_claude_api(
+        self,
+        prompt: List[Dict[str, Any]],
+        on_token: Optional[Callable[[str], None]] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Call Claude API for analysis, streaming the response text; returns (text, stop_reason)"""
+        # Prompts always start with the static blocks, whose size is already known
+        dynamic_tokens = sum(
+            estimate_tokens(block["text"]) for block in prompt[len(STATIC_PROMPT_BLOCKS):]
+        )
+        budget = self._input_token_budget()
+        if dynamic_tokens > budget:
+            # Per-contract sections are capped far below the context window, so
+            # this only trips if the budgets or batch sizing are misconfigured.
+            # Fail before uploading: the API would reject it after the full transfer
+            logger.error(
+                "Claude prompt over input budget",
+                extra={
+                    "static_tokens": STATIC_PROMPT_TOKENS,
+                    "dynamic_tokens": dynamic_tokens,
+                    "budget_tokens": budget
+                }
+            )
+            raise ValueError(
+                f"Prompt exceeds input budget ({dynamic_tokens} > {budget} estimated tokens)"
+            )
         
         payload = {
-            "model": self.model,
-            "max_tokens": self.max_tokens,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.1  # Low temperature for consistent analysis
+            **self._payload_skeleton,
+            "messages": [{"role": "user", "content": prompt}]
         }
+        if model:
+            payload["model"] = model
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        
+        session = await self._get_session()
+        # The same payload is resent on retry, so the prompt cache still applies
+        for attempt in range(CLAUDE_MAX_RETRIES + 1):
+            await self._get_rate_limiter().acquire()
+            try:
+                async with self._get_semaphore():
+                    async with session.post(
+                        self.base_url,
+                        headers=self._headers,
+                        json=payload
+                    ) as response:
+                        if response.status == 200:
+                            return await self._read_stream(response, on_token)
+                        
+                        error_text = await response.text()
+                        if response.status not in RETRYABLE_STATUSES or attempt == CLAUDE_MAX_RETRIES:
+                            raise Exception(f"Claude API error {response.status}: {error_text}")
+                        
+                        retry_after = response.headers.get("retry-after")
+                        reason = f"returned {response.status}"
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                # Timeouts and dropped connections count against the retry budget
+                if attempt == CLAUDE_MAX_RETRIES:
+                    raise
+                retry_after = None
+                reason = f"request failed ({type(e).__name__})"
+            
+            delay = self._retry_delay(attempt, retry_after)
+            logger.warning(
+                f"Claude API {reason}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{CLAUDE_MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    async def _read_stream(
+        response: aiohttp.ClientResponse,
+        on_token: Optional[Callable[[str], None]]
+    ) -> Tuple[str, Optional[str]]:
+        """Collect the text deltas and stop reason from a streamed Messages API response"""
+        # Server-sent events: only "data:" lines carry payloads, and only text
+        # deltas, the final message delta and errors matter, so other events
+        # are skipped without decoding
+        chunks = []
+        stop_reason = None
+        async for line in response.content:
+            if not line.startswith(b"data:"):
+                continue
+            if (b'"content_block_delta"' not in line and b'"message_delta"' not in line
+                    and b'"error"' not in line):
+                continue
+            event = orjson.loads(line[5:])
+            event_type = event.get("type")
+            if event_type == "content_block_delta":
+                text = event["delta"].get("text")
+                if text:
+                    chunks.append(text)
+                    if on_token:
+                        on_token(text)
+            elif event_type == "message_delta":
+                stop_reason = event.get("delta", {}).get("stop_reason") or stop_reason
+            elif event_type == "error":
+                raise Exception(f"Claude API stream error: {event.get('error')}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["content"][0]["text"]
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Claude API error {response.status}: {error_text}")
-    
-    def _parse_ai_response(self, ai_response: str) -> Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]:
+        return "".join(chunks), stop_reason
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+        """Exponential backoff with jitter, honouring a retry-after header"""
+        delay = RETRY_BASE_DELAY_SECONDS * 2 ** attempt + random.random()
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return min(RETRY_MAX_DELAY_SECONDS, delay)
+    
+    @staticmethod
+    def _extract_json(ai_response: str) -> Dict[str, Any]:
+        """Extract the JSON object from a response (Claude sometimes adds extra text)"""
+        json_start = ai_response.find('{')
+        while json_start != -1:
+            json_end = find_object_end(ai_response, json_start)
+            if json_end == -1:
+                break
+            try:
+                return orjson.loads(ai_response[json_start:json_end])
+            except orjson.JSONDecodeError:
+                # A stray brace in leading prose; try the next candidate
+                json_start = ai_response.find('{', json_start + 1)
+        
+        raise ValueError("No JSON found in AI response")
+    
+    def _parse_ai_response(
+        self,
+        ai_response: str,
+        model: Optional[str] = None
+    ) -> Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]:
         """Parse Claude's JSON response into structured data"""
+        model = model or self.model
+        if not ai_response.strip():
+            logger.error("Failed to parse AI response: empty response")
+            return [], ScorpiusAnalysis(
+                model_used=model,
+                confidence_score=0.0,
+                risk_assessment=PARSE_FAILED_ASSESSMENT,
+                ai_reasoning="Failed to parse AI response: empty response"
+            )
+        
         try:
-            # Extract JSON from response (Claude sometimes adds extra text)
-            json_start = ai_response.find('{')
-            json_end = ai_response.rfind('}') + 1
+            data = self._extract_json(ai_response)
+            return self._parse_analysis_data(data, model)
             
-            if json_start == -1 or json_end == 0:
-                raise ValueError("No JSON found in AI response")
-            
-            json_str = ai_response[json_start:json_end]
-            data = json.loads(json_str)
+        except Exception as e:
+            logger.error(f"Failed to parse AI response: {e}")
+            logger.debug(f"AI response was: {ai_response}")
             
-            # Parse vulnerabilities
-            vulnerabilities = []
-            for vuln_data in data.get("vulnerabilities", []):
+            # Return fallback analysis
+            return [], ScorpiusAnalysis(
+                model_used=model,
+                confidence_score=0.0,
+                risk_assessment=PARSE_FAILED_ASSESSMENT,
+                ai_reasoning=f"Failed to parse AI response: {str(e)}"
+            )
+    
+    def _parse_analysis_data(
+        self,
+        data: Dict[str, Any],
+        model: Optional[str] = None
+    ) -> Tuple[List[VulnerabilityFinding], ScorpiusAnalysis]:
+        """Convert one decoded OUTPUT FORMAT object into structured data"""
+        # Parse vulnerabilities
+        vulnerabilities = []
+        for vuln_data in data.get("vulnerabilities") or []:
+            # One malformed finding should not discard the rest of the response
+            try:
                 vuln = VulnerabilityFinding(
-                    vuln_type=VulnerabilityType(vuln_data.get("vuln_type", "backdoor")),
-                    severity=VulnerabilityLevel(vuln_data.get("severity", "medium")),
+                    vuln_type=VULN_TYPE_MAP.get(vuln_data.get("vuln_type"), VulnerabilityType.BACKDOOR),
+                    severity=VULN_LEVEL_MAP.get(vuln_data.get("severity"), VulnerabilityLevel.MEDIUM),
                     title=vuln_data.get("title", "Unknown vulnerability"),
                     description=vuln_data.get("description", ""),
                     function_name=vuln_data.get("function_name"),
@@ -258,34 +1069,28 @@ BE EXTREMELY THOROUGH. This is for enterprise security - accuracy is critical.
                     confidence=vuln_data.get("confidence", 0.5),
                     ai_analysis=vuln_data.get("ai_analysis")
                 )
-                vulnerabilities.append(vuln)
-            
-            # Parse analysis
-            analysis_data = data.get("analysis", {})
-            analysis = ScorpiusAnalysis(
-                model_used=self.model,
-                confidence_score=analysis_data.get("confidence_score", 0.0),
-                risk_assessment=analysis_data.get("risk_assessment", "Unknown risk"),
-                attack_vectors=analysis_data.get("attack_vectors", []),
-                exploitation_complexity=analysis_data.get("exploitation_complexity", "Unknown"),
-                business_impact=analysis_data.get("business_impact", "Unknown impact"),
-                recommendations=analysis_data.get("recommendations", []),
-                ai_reasoning=analysis_data.get("ai_reasoning", "")
-            )
-            
-            return vulnerabilities, analysis
-            
-        except Exception as e:
-            logger.error(f"Failed to parse AI response: {e}")
-            logger.debug(f"AI response was: {ai_response}")
-            
-            # Return fallback analysis
-            return [], ScorpiusAnalysis(
-                model_used=self.model,
-                confidence_score=0.0,
-                risk_assessment="Analysis parsing failed",
-                ai_reasoning=f"Failed to parse AI response: {str(e)}"
-            )
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f"Skipping malformed AI finding: {e}")
+                continue
+            vulnerabilities.append(vuln)
+        
+        # Parse analysis; a missing block degrades to defaults
+        analysis_data = data.get("analysis")
+        if not isinstance(analysis_data, dict):
+            logger.warning("AI response has no analysis block")
+            analysis_data = {}
+        analysis = ScorpiusAnalysis(
+            model_used=model or self.model,
+            confidence_score=analysis_data.get("confidence_score", 0.0),
+            risk_assessment=analysis_data.get("risk_assessment", "Unknown risk"),
+            attack_vectors=analysis_data.get("attack_vectors", []),
+            exploitation_complexity=analysis_data.get("exploitation_complexity", "Unknown"),
+            business_impact=analysis_data.get("business_impact", "Unknown impact"),
+            recommendations=analysis_data.get("recommendations", []),
+            ai_reasoning=analysis_data.get("ai_reasoning", "")
+        )
+        
+        return vulnerabilities, analysis
 
 
 async def test_ai_analyzer():
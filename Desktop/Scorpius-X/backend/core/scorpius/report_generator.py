@@ -2,15 +2,20 @@
 Scorpius Report Generator
 Creates comprehensive HTML and PDF vulnerability reports
 """
-import json
+import asyncio
+import gzip
 import logging
+from bisect import bisect_right
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import uuid
-import base64
+from typing import Dict, List, Optional, Any, Tuple
 import os
 
+import numpy as np
+import orjson
+from jinja2 import Environment, FileSystemLoader, Template
+
 from models.scorpius_models import (
     VulnerabilityFinding, ScorpiusAnalysis, ContractInfo,
     VulnerabilityLevel, VulnerabilityType
@@ -18,16 +23,72 @@ from models.scorpius_models import (
 
 logger = logging.getLogger(__name__)
 
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "reports" / "templates"
+REPORT_TEMPLATE_NAME = "scorpius_report.html.j2"
+
+# Risk score weight per severity; unknown severities count as LOW
+SEVERITY_WEIGHTS = {
+    VulnerabilityLevel.CRITICAL: 4.0,
+    VulnerabilityLevel.HIGH: 3.0,
+    VulnerabilityLevel.MEDIUM: 2.0,
+    VulnerabilityLevel.LOW: 1.0,
+    VulnerabilityLevel.INFO: 0.5
+}
+
+# Display strings used by the HTML template, built once per enum member
+SEVERITY_DISPLAY = {
+    level: (level.value.lower(), level.value.upper()) for level in VulnerabilityLevel
+}
+VULN_TYPE_LABELS = {
+    vuln_type: vuln_type.value.replace('_', ' ').title() for vuln_type in VulnerabilityType
+}
+
+# Array layout of SEVERITY_WEIGHTS for vectorized scoring; the extra
+# trailing slot holds unknown severities at the LOW weight
+_SEVERITY_ORDER = tuple(SEVERITY_WEIGHTS)
+_SEVERITY_INDEX = {level: i for i, level in enumerate(_SEVERITY_ORDER)}
+_UNKNOWN_SEVERITY_INDEX = len(_SEVERITY_ORDER)
+_SEVERITY_WEIGHT_ARRAY = np.array(
+    [SEVERITY_WEIGHTS[level] for level in _SEVERITY_ORDER] + [1.0]
+)
+
+# Below this many findings the plain loop beats NumPy's setup cost
+VECTORIZED_SUMMARY_MIN_FINDINGS = 256
+
+# Lower bounds of each risk level above MINIMAL, ascending
+RISK_LEVEL_THRESHOLDS = (2.0, 4.0, 6.0, 8.0)
+RISK_LEVELS = ("MINIMAL", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+
+def gzip_path(report_path: Path) -> Path:
+    """Path of the gzip-compressed copy written next to an HTML report"""
+    return report_path.with_name(report_path.name + ".gz")
+
 
 class ReportGenerator:
     """Generate comprehensive vulnerability reports"""
     
+    # Compiled once per process; a generator is built for every scan
+    _template: Optional[Template] = None
+    
     def __init__(self, reports_dir: Optional[str] = None):
         self.reports_dir = Path(reports_dir or "reports/scorpius")
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load the existing HTML template from advanced_exploit_suite
-        self.template_path = Path("C:/Users/ADMIN/Desktop/advanced_exploit_suite/reports/Scorpius_POC_Report.html")
+        if ReportGenerator._template is None:
+            env = Environment(
+                loader=FileSystemLoader(str(TEMPLATES_DIR)),
+                autoescape=True,
+                auto_reload=False,
+                trim_blocks=True,
+                lstrip_blocks=True,
+                cache_size=50
+            )
+            env.globals.update(
+                severity_display=SEVERITY_DISPLAY,
+                vuln_type_labels=VULN_TYPE_LABELS
+            )
+            ReportGenerator._template = env.get_template(REPORT_TEMPLATE_NAME)
     
     async def generate_report(
         self,
@@ -45,16 +106,16 @@ class ReportGenerator:
             Dict with paths to generated reports
         """
         try:
-            # Generate HTML report
-            html_path = await self._generate_html_report(
+            # Build the shared report context once for both formats
+            ctx = self._build_report_ctx(
                 scan_id, contract_address, contract_info,
                 vulnerabilities, ai_analysis, scan_config
             )
             
-            # Generate JSON report
-            json_path = await self._generate_json_report(
-                scan_id, contract_address, contract_info,
-                vulnerabilities, ai_analysis, scan_config
+            # Generate HTML and JSON reports concurrently
+            html_path, json_path = await asyncio.gather(
+                self._generate_html_report(ctx),
+                self._generate_json_report(ctx)
             )
             
             # TODO: Generate PDF report (requires additional libraries)
@@ -70,7 +131,7 @@ class ReportGenerator:
             logger.error(f"Report generation failed: {e}")
             return {}
     
-    async def _generate_html_report(
+    def _build_report_ctx(
         self,
         scan_id: str,
         contract_address: str,
@@ -78,304 +139,59 @@ class ReportGenerator:
         vulnerabilities: List[VulnerabilityFinding],
         ai_analysis: ScorpiusAnalysis,
         scan_config: Dict[str, Any]
-    ) -> Path:
-        """Generate HTML vulnerability report"""
-        
-        # Calculate statistics
-        total_vulns = len(vulnerabilities)
-        critical_count = sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.CRITICAL)
-        high_count = sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.HIGH)
-        medium_count = sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.MEDIUM)
-        low_count = sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.LOW)
-        
-        # Calculate risk score
-        risk_score = self._calculate_risk_score(vulnerabilities)
-        risk_level = self._get_risk_level(risk_score)
-        
-        # Generate vulnerability sections
-        vuln_sections = self._generate_vulnerability_sections(vulnerabilities)
-        
-        # Create HTML content
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Scorpius Security Scan - {contract_address}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #ffffff;
-            background: #0a0a0a;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #1a1a1a;
-            padding: 40px;
-            border-radius: 12px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-            border: 1px solid #333;
-        }}
-        
-        .header {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding: 30px;
-            background: linear-gradient(135deg, #2a2a2a 0%, #1a1a1a 100%);
-            border-radius: 8px;
-            border: 1px solid #444;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 700;
-            color: #00ffff;
-            text-shadow: 0 0 10px #00ffff;
-        }}
-        
-        .metadata {{
-            background: #222;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-            border-left: 4px solid #00ffff;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        
-        .stat-card {{
-            background: #222;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            border: 1px solid #444;
-        }}
-        
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #00ffff;
-        }}
-        
-        .critical {{ color: #ff4757; }}
-        .high {{ color: #ff6b35; }}
-        .medium {{ color: #ffa502; }}
-        .low {{ color: #26de81; }}
-        
-        .vulnerability {{
-            background: #1e1e1e;
-            margin: 20px 0;
-            border-radius: 8px;
-            border-left: 4px solid;
-            overflow: hidden;
-        }}
-        
-        .vulnerability.critical {{ border-left-color: #ff4757; }}
-        .vulnerability.high {{ border-left-color: #ff6b35; }}
-        .vulnerability.medium {{ border-left-color: #ffa502; }}
-        .vulnerability.low {{ border-left-color: #26de81; }}
-        
-        .vuln-header {{
-            background: #2a2a2a;
-            padding: 15px 20px;
-            border-bottom: 1px solid #444;
-        }}
-        
-        .vuln-title {{
-            font-size: 1.4em;
-            margin-bottom: 5px;
-        }}
-        
-        .vuln-meta {{
-            color: #888;
-            font-size: 0.9em;
-        }}
-        
-        .vuln-body {{
-            padding: 20px;
-        }}
-        
-        .code-block {{
-            background: #0d1117;
-            color: #e6edf3;
-            padding: 15px;
-            border-radius: 6px;
-            margin: 10px 0;
-            overflow-x: auto;
-            font-family: 'Monaco', 'Menlo', monospace;
-            font-size: 0.9em;
-            border: 1px solid #30363d;
-        }}
-        
-        .ai-analysis {{
-            background: #1a2f3a;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-            border-left: 4px solid #00ffff;
-        }}
-        
-        .exploit-code {{
-            background: #2d1b1b;
-            padding: 15px;
-            border-radius: 6px;
-            border-left: 4px solid #ff4757;
-            margin: 10px 0;
-        }}
-        
-        .mitigation {{
-            background: #1b2d1b;
-            padding: 15px;
-            border-radius: 6px;
-            border-left: 4px solid #26de81;
-            margin: 10px 0;
-        }}
-        
-        h2 {{
-            color: #00ffff;
-            font-size: 1.8em;
-            margin: 30px 0 15px 0;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #444;
-        }}
-        
-        h3 {{
-            color: #cccccc;
-            font-size: 1.4em;
-            margin: 25px 0 10px 0;
-        }}
-        
-        .risk-indicator {{
-            display: inline-block;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-        }}
-        
-        .risk-critical {{ background: #ff4757; color: white; }}
-        .risk-high {{ background: #ff6b35; color: white; }}
-        .risk-medium {{ background: #ffa502; color: white; }}
-        .risk-low {{ background: #26de81; color: white; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🦂 SCORPIUS SECURITY SCAN</h1>
-            <p>Advanced AI-Powered Smart Contract Vulnerability Analysis</p>
-        </div>
-        
-        <div class="metadata">
-            <h3>📊 Scan Overview</h3>
-            <p><strong>Contract:</strong> {contract_address}</p>
-            <p><strong>Scan ID:</strong> {scan_id}</p>
-            <p><strong>Timestamp:</strong> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
-            <p><strong>AI Model:</strong> {ai_analysis.model_used}</p>
-            <p><strong>Overall Risk:</strong> <span class="risk-indicator risk-{risk_level.lower()}">{risk_level}</span></p>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-number">{total_vulns}</div>
-                <div>Total Vulnerabilities</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number critical">{critical_count}</div>
-                <div>Critical</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number high">{high_count}</div>
-                <div>High</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number medium">{medium_count}</div>
-                <div>Medium</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number low">{low_count}</div>
-                <div>Low</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{risk_score:.1f}/10</div>
-                <div>Risk Score</div>
-            </div>
-        </div>
-        
-        <div class="ai-analysis">
-            <h3>🤖 AI Analysis Summary</h3>
-            <p><strong>Risk Assessment:</strong> {ai_analysis.risk_assessment}</p>
-            <p><strong>Exploitation Complexity:</strong> {ai_analysis.exploitation_complexity}</p>
-            <p><strong>Business Impact:</strong> {ai_analysis.business_impact}</p>
-            <p><strong>Confidence Score:</strong> {ai_analysis.confidence_score:.2f}/1.0</p>
-            
-            {self._format_ai_recommendations(ai_analysis.recommendations)}
-            
-            <h4>AI Reasoning:</h4>
-            <p>{ai_analysis.ai_reasoning}</p>
-        </div>
+    ) -> Dict[str, Any]:
+        """
+        Compute everything both report formats share: one timestamp, the
+        severity summary and the overall risk level
         
-        <h2>🚨 Vulnerability Details</h2>
-        {vuln_sections}
+        Returns:
+            Report context used as the template context and the JSON source
+        """
+        severity_counts, risk_score = self._summarize(vulnerabilities)
         
-        <h2>📈 Contract Information</h2>
-        <div class="metadata">
-            <p><strong>Address:</strong> {contract_info.address}</p>
-            <p><strong>Verified:</strong> {'Yes' if contract_info.verified else 'No'}</p>
-            <p><strong>Proxy Contract:</strong> {'Yes' if contract_info.proxy else 'No'}</p>
-            <p><strong>Balance:</strong> {contract_info.balance} ETH</p>
-            <p><strong>Transaction Count:</strong> {contract_info.tx_count:,}</p>
-            {f'<p><strong>Implementation:</strong> {contract_info.implementation}</p>' if contract_info.implementation else ''}
-        </div>
+        return {
+            "scan_id": scan_id,
+            "contract_address": contract_address,
+            "generated_at": datetime.utcnow(),
+            "scan_config": scan_config,
+            "contract_info": contract_info,
+            "vulnerabilities": vulnerabilities,
+            "ai_analysis": ai_analysis,
+            "summary": {
+                "total_vulnerabilities": len(vulnerabilities),
+                "critical_count": severity_counts[VulnerabilityLevel.CRITICAL],
+                "high_count": severity_counts[VulnerabilityLevel.HIGH],
+                "medium_count": severity_counts[VulnerabilityLevel.MEDIUM],
+                "low_count": severity_counts[VulnerabilityLevel.LOW],
+                "risk_score": risk_score
+            },
+            "risk_level": self._get_risk_level(risk_score)
+        }
+    
+    async def _generate_html_report(self, ctx: Dict[str, Any]) -> Path:
+        """Generate HTML vulnerability report"""
         
-        <div style="margin-top: 40px; text-align: center; color: #666; font-size: 0.9em;">
-            <p>Generated by Scorpius AI Security Scanner | {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
-            <p>This report contains confidential security information. Handle with care.</p>
-        </div>
-    </div>
-</body>
-</html>"""
+        # Render HTML from the precompiled template
+        html_content = self._template.render(ctx)
         
         # Save HTML report
-        report_path = self.reports_dir / f"scorpius_scan_{scan_id}.html"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        report_path = self.reports_dir / f"scorpius_scan_{ctx['scan_id']}.html"
+        await asyncio.to_thread(self._write_html_report, report_path, html_content)
         
         logger.info(f"HTML report generated: {report_path}")
         return report_path
     
-    async def _generate_json_report(
-        self,
-        scan_id: str,
-        contract_address: str,
-        contract_info: ContractInfo,
-        vulnerabilities: List[VulnerabilityFinding],
-        ai_analysis: ScorpiusAnalysis,
-        scan_config: Dict[str, Any]
-    ) -> Path:
+    async def _generate_json_report(self, ctx: Dict[str, Any]) -> Path:
         """Generate JSON vulnerability report"""
         
+        contract_info = ctx["contract_info"]
+        ai_analysis = ctx["ai_analysis"]
+        
         report_data = {
-            "scan_id": scan_id,
-            "contract_address": contract_address,
-            "timestamp": datetime.utcnow().isoformat(),
-            "scan_config": scan_config,
+            "scan_id": ctx["scan_id"],
+            "contract_address": ctx["contract_address"],
+            "timestamp": ctx["generated_at"].isoformat(),
+            "scan_config": ctx["scan_config"],
             "contract_info": {
                 "address": contract_info.address,
                 "verified": contract_info.verified,
@@ -384,33 +200,7 @@ class ReportGenerator:
                 "tx_count": contract_info.tx_count,
                 "implementation": contract_info.implementation
             },
-            "summary": {
-                "total_vulnerabilities": len(vulnerabilities),
-                "critical_count": sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.CRITICAL),
-                "high_count": sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.HIGH),
-                "medium_count": sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.MEDIUM),
-                "low_count": sum(1 for v in vulnerabilities if v.severity == VulnerabilityLevel.LOW),
-                "risk_score": self._calculate_risk_score(vulnerabilities)
-            },
-            "vulnerabilities": [
-                {
-                    "id": str(uuid.uuid4()),
-                    "type": vuln.vuln_type.value,
-                    "severity": vuln.severity.value,
-                    "title": vuln.title,
-                    "description": vuln.description,
-                    "function_name": vuln.function_name,
-                    "function_signature": vuln.function_signature,
-                    "line_number": vuln.line_number,
-                    "code_snippet": vuln.code_snippet,
-                    "exploit_code": vuln.exploit_code,
-                    "mitigation": vuln.mitigation,
-                    "references": vuln.references or [],
-                    "confidence": vuln.confidence,
-                    "ai_analysis": vuln.ai_analysis
-                }
-                for vuln in vulnerabilities
-            ],
+            "summary": ctx["summary"],
             "ai_analysis": {
                 "model_used": ai_analysis.model_used,
                 "confidence_score": ai_analysis.confidence_score,
@@ -423,122 +213,153 @@ class ReportGenerator:
             }
         }
         
-        # Save JSON report
-        report_path = self.reports_dir / f"scorpius_scan_{scan_id}.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        # Save JSON report, streaming findings so only one is held as a dict
+        report_path = self.reports_dir / f"scorpius_scan_{ctx['scan_id']}.json"
+        await asyncio.to_thread(
+            self._write_json_report, report_path, report_data, ctx["vulnerabilities"]
+        )
         
         logger.info(f"JSON report generated: {report_path}")
         return report_path
     
-    def _generate_vulnerability_sections(self, vulnerabilities: List[VulnerabilityFinding]) -> str:
-        """Generate HTML sections for each vulnerability"""
-        if not vulnerabilities:
-            return "<div class='metadata'><p>✅ No vulnerabilities detected</p></div>"
-        
-        sections = []
-        
-        for i, vuln in enumerate(vulnerabilities, 1):
-            severity_class = vuln.severity.value.lower()
-            
-            section = f"""
-            <div class="vulnerability {severity_class}">
-                <div class="vuln-header">
-                    <div class="vuln-title">
-                        {i}. {vuln.title}
-                        <span class="risk-indicator risk-{severity_class}">{vuln.severity.value.upper()}</span>
-                    </div>
-                    <div class="vuln-meta">
-                        Type: {vuln.vuln_type.value.replace('_', ' ').title()} | 
-                        Confidence: {vuln.confidence:.1%}
-                        {f' | Function: {vuln.function_name}' if vuln.function_name else ''}
-                    </div>
-                </div>
-                <div class="vuln-body">
-                    <p><strong>Description:</strong> {vuln.description}</p>
-                    
-                    {f'<div class="code-block"><strong>Vulnerable Code:</strong><br>{vuln.code_snippet}</div>' if vuln.code_snippet else ''}
-                    
-                    {f'<div class="exploit-code"><strong>⚠️ Exploit Code:</strong><br><pre>{vuln.exploit_code}</pre></div>' if vuln.exploit_code else ''}
-                    
-                    {f'<div class="mitigation"><strong>🛡️ Mitigation:</strong><br>{vuln.mitigation}</div>' if vuln.mitigation else ''}
-                    
-                    {f'<div class="ai-analysis"><strong>🤖 AI Analysis:</strong><br>{vuln.ai_analysis}</div>' if vuln.ai_analysis else ''}
-                    
-                    {self._format_references(vuln.references) if vuln.references else ''}
-                </div>
-            </div>
-            """
-            sections.append(section)
-        
-        return ''.join(sections)
-    
-    def _format_ai_recommendations(self, recommendations: Optional[List[str]]) -> str:
-        """Format AI recommendations as HTML"""
-        if not recommendations:
-            return ""
-        
-        items = ''.join(f'<li>{rec}</li>' for rec in recommendations)
-        return f"""
-        <h4>AI Recommendations:</h4>
-        <ul style="margin-left: 20px;">
-            {items}
-        </ul>
+    def _write_html_report(self, report_path: Path, html_content: str) -> None:
+        """
+        Write the HTML report plus a gzip-compressed sibling (<name>.html.gz)
+        that the download endpoint serves to clients accepting gzip
         """
+        data = html_content.encode('utf-8')
+        report_path.write_bytes(data)
+        gzip_path(report_path).write_bytes(gzip.compress(data, compresslevel=6))
     
-    def _format_references(self, references: List[str]) -> str:
-        """Format vulnerability references as HTML"""
-        if not references:
-            return ""
+    def _write_json_report(
+        self,
+        report_path: Path,
+        report_data: Dict[str, Any],
+        vulnerabilities: List[VulnerabilityFinding]
+    ) -> None:
+        """
+        Write the JSON report with the vulnerabilities array serialized one
+        finding at a time, inserted before the trailing ai_analysis section.
+        Output matches orjson's OPT_INDENT_2 layout for the full document.
+        """
+        # Only needed for finding IDs, so kept off the module import path
+        import uuid
         
-        links = []
-        for ref in references:
-            if ref.startswith('http'):
-                links.append(f'<a href="{ref}" target="_blank" style="color: #00ffff;">{ref}</a>')
-            else:
-                links.append(ref)
+        header = dict(report_data)
+        ai_section = header.pop("ai_analysis")
         
-        return f'<p><strong>References:</strong> {", ".join(links)}</p>'
+        with open(report_path, 'wb') as f:
+            # Drop the closing "\n}" so the remaining keys can be appended
+            f.write(orjson.dumps(header, default=str, option=orjson.OPT_INDENT_2)[:-2])
+            
+            if not vulnerabilities:
+                f.write(b',\n  "vulnerabilities": [],')
+            else:
+                f.write(b',\n  "vulnerabilities": [')
+                # One urandom call for every finding's UUID instead of one each
+                id_bytes = os.urandom(16 * len(vulnerabilities))
+                separator = b'\n    '
+                for i, vuln in enumerate(vulnerabilities):
+                    finding_id = uuid.UUID(bytes=id_bytes[i * 16:i * 16 + 16], version=4)
+                    record = orjson.dumps(
+                        self._vulnerability_record(vuln, str(finding_id)),
+                        default=str,
+                        option=orjson.OPT_INDENT_2
+                    )
+                    f.write(separator)
+                    f.write(record.replace(b'\n', b'\n    '))
+                    separator = b',\n    '
+                f.write(b'\n  ],')
+            
+            f.write(b'\n  "ai_analysis": ')
+            ai_json = orjson.dumps(ai_section, default=str, option=orjson.OPT_INDENT_2)
+            f.write(ai_json.replace(b'\n', b'\n  '))
+            f.write(b'\n}')
     
-    def _calculate_risk_score(self, vulnerabilities: List[VulnerabilityFinding]) -> float:
-        """Calculate overall risk score (0-10)"""
-        if not vulnerabilities:
-            return 0.0
-        
-        severity_weights = {
-            VulnerabilityLevel.CRITICAL: 4.0,
-            VulnerabilityLevel.HIGH: 3.0,
-            VulnerabilityLevel.MEDIUM: 2.0,
-            VulnerabilityLevel.LOW: 1.0,
-            VulnerabilityLevel.INFO: 0.5
+    def _vulnerability_record(
+        self,
+        vuln: VulnerabilityFinding,
+        finding_id: str
+    ) -> Dict[str, Any]:
+        """Convert a finding to its JSON report representation"""
+        return {
+            "id": finding_id,
+            "type": vuln.vuln_type.value,
+            "severity": vuln.severity.value,
+            "title": vuln.title,
+            "description": vuln.description,
+            "function_name": vuln.function_name,
+            "function_signature": vuln.function_signature,
+            "line_number": vuln.line_number,
+            "code_snippet": vuln.code_snippet,
+            "exploit_code": vuln.exploit_code,
+            "mitigation": vuln.mitigation,
+            "references": vuln.references or [],
+            "confidence": vuln.confidence,
+            "ai_analysis": vuln.ai_analysis
         }
+    
+    def _summarize(
+        self,
+        vulnerabilities: List[VulnerabilityFinding]
+    ) -> Tuple[Counter, float]:
+        """
+        Count findings per severity and calculate the overall risk score
+        in a single pass
+        
+        Returns:
+            Tuple of (severity counts, risk score on a 0-10 scale)
+        """
+        if len(vulnerabilities) >= VECTORIZED_SUMMARY_MIN_FINDINGS:
+            return self._summarize_vectorized(vulnerabilities)
         
+        severity_counts = Counter()
         total_score = 0.0
         max_possible = 0.0
         
         for vuln in vulnerabilities:
-            weight = severity_weights.get(vuln.severity, 1.0)
-            confidence = vuln.confidence or 0.5
-            
-            total_score += weight * confidence
+            severity_counts[vuln.severity] += 1
+            weight = SEVERITY_WEIGHTS.get(vuln.severity, 1.0)
+            total_score += weight * (vuln.confidence or 0.5)
             max_possible += weight
         
         if max_possible == 0:
-            return 0.0
+            return severity_counts, 0.0
+        
+        # Normalize to 0-10 scale
+        return severity_counts, min((total_score / max_possible) * 10, 10.0)
+    
+    def _summarize_vectorized(
+        self,
+        vulnerabilities: List[VulnerabilityFinding]
+    ) -> Tuple[Counter, float]:
+        """NumPy version of _summarize for large finding lists"""
+        count = len(vulnerabilities)
+        severities = np.fromiter(
+            (_SEVERITY_INDEX.get(v.severity, _UNKNOWN_SEVERITY_INDEX) for v in vulnerabilities),
+            dtype=np.int8,
+            count=count
+        )
+        confidences = np.fromiter(
+            (v.confidence or 0.5 for v in vulnerabilities),
+            dtype=np.float64,
+            count=count
+        )
+        
+        per_severity = np.bincount(severities, minlength=len(_SEVERITY_WEIGHT_ARRAY))
+        severity_counts = Counter({
+            level: int(n) for level, n in zip(_SEVERITY_ORDER, per_severity) if n
+        })
+        
+        weights = _SEVERITY_WEIGHT_ARRAY[severities]
+        max_possible = weights.sum()
+        if max_possible == 0:
+            return severity_counts, 0.0
         
         # Normalize to 0-10 scale
-        normalized = (total_score / max_possible) * 10
-        return min(normalized, 10.0)
+        risk_score = float(weights @ confidences / max_possible * 10)
+        return severity_counts, min(risk_score, 10.0)
     
     def _get_risk_level(self, risk_score: float) -> str:
         """Get risk level based on score"""
-        if risk_score >= 8.0:
-            return "CRITICAL"
-        elif risk_score >= 6.0:
-            return "HIGH"
-        elif risk_score >= 4.0:
-            return "MEDIUM"
-        elif risk_score >= 2.0:
-            return "LOW"
-        else:
-            return "MINIMAL"
+        return RISK_LEVELS[bisect_right(RISK_LEVEL_THRESHOLDS, risk_score)]
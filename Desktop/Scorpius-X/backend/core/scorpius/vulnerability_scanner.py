@@ -68,7 +68,7 @@ class ScorpiusVulnerabilityScanner:
                 scan_type=request.scan_type.value,
                 status=ScanStatus.PENDING.value,
                 scan_config=request.__dict__,
-                ai_model="claude-3-opus",
+                ai_model=self.ai_analyzer.model,
                 user_id="scorpius_user"
             )
             
@@ -450,6 +450,8 @@ class ScorpiusVulnerabilityScanner:
                 "risk_score": risk_score,  # Add risk score to database
                 "findings": findings_json,
                 "ai_analysis": ai_analysis.__dict__,
+                # Routing picks the model per analysis; the one set at creation is only a default
+                "ai_model": ai_analysis.model_used,
                 "contract_info": contract_info.__dict__,
                 "source_code": source_code,
                 "bytecode": bytecode,
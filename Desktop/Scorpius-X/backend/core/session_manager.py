@@ -3,6 +3,13 @@ from typing import Dict, Optional
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
 import logging
 
+try:
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class SessionManager:
@@ -10,17 +17,27 @@ class SessionManager:
     Manages HTTP client sessions with connection pooling and timeout handling.
     """
     
-    def __init__(self, timeout_seconds: float = 30.0, connector_limit: int = 100):
+    def __init__(
+        self,
+        timeout_seconds: float = 30.0,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 32
+    ):
         """
         Initialize the session manager.
         
         Args:
             timeout_seconds: Default timeout for requests
             connector_limit: Maximum number of connections in the pool
+            connector_limit_per_host: Maximum connections to a single host
         """
         self._sessions: Dict[str, ClientSession] = {}
         self._timeout = ClientTimeout(total=timeout_seconds)
         self._connector_limit = connector_limit
+        self._connector_limit_per_host = connector_limit_per_host
+        # One pool shared by every session so keys hitting the same host
+        # reuse kept-alive connections and DNS answers
+        self._connector: Optional[TCPConnector] = None
         self._lock = asyncio.Lock()
 
     async def get_session(self, key: str = "default") -> ClientSession:
@@ -33,12 +50,32 @@ class SessionManager:
         Returns:
             ClientSession instance
         """
+        # Fast path: an open session needs no lock, the dict read cannot
+        # interleave with another coroutine
+        session = self._sessions.get(key)
+        if session is not None and not session.closed:
+            return session
+        
         async with self._lock:
-            if key not in self._sessions or self._sessions[key].closed:
+            session = self._sessions.get(key)
+            if session is None or session.closed:
                 logger.info(f"Creating new ClientSession for key '{key}'")
-                connector = TCPConnector(limit=self._connector_limit, ttl_dns_cache=300)
-                self._sessions[key] = ClientSession(timeout=self._timeout, connector=connector)
-        return self._sessions[key]
+                if self._connector is None or self._connector.closed:
+                    # aiodns resolves without the thread pool; together with the
+                    # DNS cache, async_retry retries reuse the cached answer
+                    self._connector = TCPConnector(
+                        limit=self._connector_limit,
+                        limit_per_host=self._connector_limit_per_host,
+                        ttl_dns_cache=300,
+                        resolver=AsyncResolver() if AIODNS_AVAILABLE else None
+                    )
+                session = ClientSession(
+                    timeout=self._timeout,
+                    connector=self._connector,
+                    connector_owner=False
+                )
+                self._sessions[key] = session
+        return session
 
     async def close_all(self) -> None:
         """Close all active sessions."""
@@ -48,6 +85,9 @@ class SessionManager:
                     logger.info(f"Closing ClientSession for key '{key}'")
                     await session.close()
                     del self._sessions[key]
+            if self._connector is not None:
+                await self._connector.close()
+                self._connector = None
             logger.info("All ClientSessions closed.")
 
     async def close_session(self, key: str) -> None:
@@ -7,6 +7,9 @@ from typing import Any, Callable, TypeVar
 getcontext().prec = 50
 logger = logging.getLogger(__name__)
 
+WEI_PER_ETHER = 10**18
+_WEI_PER_ETHER_DECIMAL = Decimal(WEI_PER_ETHER)
+
 T = TypeVar('T')
 
 def async_retry(retries: int = 3, delay: float = 1.0, backoff: float = 2.0) -> Callable:
@@ -51,9 +54,14 @@ def ether_to_wei(eth_value: float) -> int:
     Raises:
         TypeError: If eth_value is not a number
     """
-    if not isinstance(eth_value, (int, float, Decimal)):
+    if isinstance(eth_value, int):
+        return eth_value * WEI_PER_ETHER
+    if isinstance(eth_value, Decimal):
+        return int(eth_value * _WEI_PER_ETHER_DECIMAL)
+    if not isinstance(eth_value, float):
         raise TypeError("eth_value must be a number")
-    return int(Decimal(str(eth_value)) * Decimal(10**18))
+    # repr gives the shortest round-tripping literal, so 0.1 stays 0.1
+    return int(Decimal(repr(eth_value)) * _WEI_PER_ETHER_DECIMAL)
 
 def wei_to_ether(wei_value: int) -> float:
     """
@@ -68,6 +76,9 @@ def wei_to_ether(wei_value: int) -> float:
     Raises:
         TypeError: If wei_value is not an integer or Decimal
     """
-    if not isinstance(wei_value, (int, Decimal)):
+    if isinstance(wei_value, int):
+        # int / int is correctly rounded, no Decimal round trip needed
+        return wei_value / WEI_PER_ETHER
+    if not isinstance(wei_value, Decimal):
         raise TypeError("wei_value must be an integer or Decimal")
-    return float(Decimal(str(wei_value)) / Decimal(10**18))
+    return float(wei_value / _WEI_PER_ETHER_DECIMAL)
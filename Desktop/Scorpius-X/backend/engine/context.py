@@ -1,13 +1,26 @@
-
-from typing import Dict
+import threading
+from collections import OrderedDict
 from .models import ScanJob
 
+# Oldest jobs are evicted past this many so long-running servers stay bounded
+MAX_JOBS = 10_000
+
 class ScorpiusContext:
-    def __init__(self):
-        self.jobs: Dict[str, ScanJob] = {}
+    def __init__(self, max_jobs: int = MAX_JOBS):
+        self.jobs: OrderedDict[str, ScanJob] = OrderedDict()
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
 
     def add_job(self, job: ScanJob):
-        self.jobs[job.job_id] = job
+        with self._lock:
+            self.jobs[job.job_id] = job
+            self.jobs.move_to_end(job.job_id)
+            while len(self.jobs) > self._max_jobs:
+                self.jobs.popitem(last=False)
 
     def get_job(self, job_id: str) -> ScanJob | None:
-        return self.jobs.get(job_id)
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                self.jobs.move_to_end(job_id)
+            return job
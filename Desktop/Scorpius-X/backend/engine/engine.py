@@ -1,24 +1,86 @@
 import asyncio
-from typing import Dict, Any, List
-from datetime import datetime
+import bisect
+import copy
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Sequence
 import logging
+import os
+import sys
 import time
-from datetime import timezone
+import uuid
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Optional
 
 # Import the real vulnerability scanner
 from modules.real_vulnerability_scanner import scan_contract_for_vulnerabilities
-from modules.bytecode_similarity_engine import BytecodeSimilarityEngine, analyze_contract_bytecode
+from modules.bytecode_similarity_engine import (
+    BytecodeSimilarityEngine, analyze_contract_bytecode, analyze_bytecode_sync
+)
 from modules.honeypot_detector import HoneypotDetector
 
+import aiohttp
+
 logger = logging.getLogger(__name__)
 
+UTC = timezone.utc
+
+# JSON-RPC endpoint used to fetch deployed bytecode; without one the
+# bytecode path falls back to a sample pattern
+ETHEREUM_RPC_URL = os.getenv("ETHEREUM_RPC_URL")
+SAMPLE_BYTECODE = "0x608060405234801561001057600080fd5b50"  # Basic contract pattern
+
+# Raw opcode pattern hits carry no score of their own
+BYTECODE_PATTERN_CONFIDENCE = 0.6
+
+# Fields shared by every bytecode-derived finding
+BYTECODE_FINDING_DEFAULTS = {"economic_impact": 0.0}
+
+# Finished scans beyond this many are evicted oldest-first
+MAX_TRACKED_SCANS = 10_000
+ACTIVE_SCAN_STATUSES = frozenset({"pending", "running"})
+
+# Repeat honeypot probes of the same target within this window reuse results
+HONEYPOT_CACHE_TTL_SECONDS = 120.0
+HONEYPOT_CACHE_MAX_ENTRIES = 1024
+
+# Ports probed by quick_honeypot_scan
+COMMON_HONEYPOT_PORTS = (21, 22, 23, 80, 443, 2222, 8080)
+
+# Read-only default for analyze_honeypot_infrastructure
+DEFAULT_HONEYPOT_OPTIONS = MappingProxyType({
+    "include_service_detection": True,
+    "include_behavioral_analysis": True,
+    "include_timing_analysis": True,
+    "ports": None  # Use default ports
+})
+
+# Honeypot confidence bands shared by the infrastructure and quick scans:
+# below 0.5, from 0.5, and from 0.8
+HONEYPOT_CONFIDENCE_THRESHOLDS = (0.5, 0.8)
+HONEYPOT_CATEGORIES = ("suspicious", "likely_honeypot", "confirmed_honeypot")
+HONEYPOT_THREAT_LEVELS = ("LOW", "MEDIUM", "HIGH")
+
 class ScorpiusEngine:
     """Enhanced Scorpius Engine with real vulnerability scanning capabilities."""
     
     def __init__(self):
         """Initialize the Scorpius Engine with all security analysis components."""
-        self.active_scans: Dict[str, Dict[str, Any]] = {}
+        # Hot per-scan fields polled by status endpoints, in submission order
+        self._status: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Results written once when a scan finishes
+        self._details: Dict[str, Dict[str, Any]] = {}
+        self._max_scans = MAX_TRACKED_SCANS
+        # (target, ports, probe flags) -> (monotonic store time, analysis)
+        self._hp_cache: Dict[tuple, tuple] = {}
+        # Bytecode analysis is CPU-bound; started on first use
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        # Pooled keep-alive client for RPC calls; created by start() or on first use
+        self._http: Optional[aiohttp.ClientSession] = None
+        # Running scan tasks by job id; holding them keeps them from being collected
+        self._scan_tasks: Dict[str, asyncio.Task] = {}
         self.bytecode_engine = BytecodeSimilarityEngine()
         self.honeypot_detector = HoneypotDetector()
         logger.info("ScorpiusEngine initialized with bytecode similarity and honeypot detection engines")
@@ -35,34 +97,44 @@ class ScorpiusEngine:
         Returns:
             job_id: Unique identifier for the scan job
         """
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         
         # Initialize scan job
-        self.active_scans[job_id] = {
+        self._status[job_id] = {
             "job_id": job_id,
             "contract_address": contract_address,
             "status": "pending",
-            "start_time": datetime.utcnow(),
+            "start_time": datetime.now(UTC),
             "progress": 0
         }
+        self._evict_finished_scans()
         
         # Start the scan asynchronously
-        asyncio.create_task(self._perform_scan(job_id, contract_address, contract_source, analysis_types))
+        task = asyncio.create_task(self._perform_scan(job_id, contract_address, contract_source, analysis_types))
+        self._scan_tasks[job_id] = task
+        task.add_done_callback(lambda _: self._scan_tasks.pop(job_id, None))
         
-        logger.info(f"Submitted scan job {job_id} for contract {contract_address}")
+        logger.info("Submitted scan job %s for contract %s", job_id, contract_address)
         return job_id
     
+    async def wait_for_scan(self, job_id: str) -> None:
+        """Wait until a submitted scan finishes; returns at once if it already has."""
+        task = self._scan_tasks.get(job_id)
+        if task is not None:
+            await task
+    
     async def _perform_scan(self, job_id: str, contract_address: str, contract_source: str = None, analysis_types: List[str] = None) -> None:
         """
         Perform the actual vulnerability scan using real security tools.
         """
         try:
             # Update status
-            self.active_scans[job_id]["status"] = "running"
-            self.active_scans[job_id]["progress"] = 10
+            scan_status = self._status[job_id]
+            scan_status["status"] = "running"
+            scan_status["progress"] = 10
             
             if contract_source:
-                logger.info(f"Running real vulnerability scan for {contract_address}")
+                logger.info("Running real vulnerability scan for %s", contract_address)
                 
                 # Use the real vulnerability scanner
                 scan_results = await scan_contract_for_vulnerabilities(
@@ -70,139 +142,119 @@ class ScorpiusEngine:
                     analysis_types=analysis_types or ["static", "symbolic"]
                 )
                 
-                self.active_scans[job_id].update({
-                    "status": "completed",
-                    "progress": 100,
+                self._finish_scan(job_id, "completed", {
                     "vulnerabilities": scan_results["vulnerabilities"],
                     "risk_score": scan_results["risk_score"],
                     "total_vulnerabilities": scan_results["total_vulnerabilities"],
                     "analysis_duration": scan_results["analysis_duration"],
                     "engines_used": scan_results["engines_used"],
-                    "end_time": datetime.utcnow()
+                    "end_time": datetime.now(UTC)
                 })
                 
-                logger.info(f"Scan {job_id} completed: {scan_results['total_vulnerabilities']} vulnerabilities found")
+                logger.info("Scan %s completed: %s vulnerabilities found", job_id, scan_results["total_vulnerabilities"])
                 
             else:
                 # If no source code provided, run basic blockchain analysis
                 await self._perform_blockchain_analysis(job_id, contract_address)
                 
         except Exception as e:
-            logger.error(f"Scan {job_id} failed: {e}")
-            self.active_scans[job_id].update({
-                "status": "failed",
+            logger.error("Scan %s failed: %s", job_id, e)
+            self._finish_scan(job_id, "failed", {
                 "error": str(e),
-                "end_time": datetime.utcnow()
+                "end_time": datetime.now(UTC)
             })
     
     async def _perform_blockchain_analysis(self, job_id: str, contract_address: str) -> None:
         """Perform comprehensive bytecode analysis when source code is not available."""
         try:
-            logger.info(f"Starting bytecode analysis for contract {contract_address}")
+            logger.info("Starting bytecode analysis for contract %s", contract_address)
             
             # Update progress
-            self.active_scans[job_id]["progress"] = 20
+            scan_status = self._status[job_id]
+            scan_status["progress"] = 20
             
-            # Try to fetch contract bytecode (this would require web3 connection)
-            # For now, we'll use a placeholder but the infrastructure is ready
             try:
-                # This would be the real implementation:
-                # from web3 import Web3
-                # w3 = Web3(Web3.HTTPProvider("https://mainnet.infura.io/v3/YOUR_KEY"))
-                # bytecode = w3.eth.get_code(contract_address)
+                logger.debug("Fetching bytecode for %s", contract_address)
                 
-                # For demonstration, we'll simulate some bytecode analysis
-                logger.info(f"Fetching bytecode for {contract_address}")
-                await asyncio.sleep(1)  # Simulate fetch time
+                # Single-address case of the batched fetch + analysis pipeline
+                bytecode_results = (await self.analyze_bytecode_batch([contract_address]))[contract_address]
                 
                 # Update progress
-                self.active_scans[job_id]["progress"] = 50
-                
-                # For now, we'll perform analysis on a sample bytecode pattern
-                # In real implementation, this would be the actual contract bytecode
-                sample_bytecode = "0x608060405234801561001057600080fd5b50"  # Basic contract pattern
-                
-                logger.info(f"Running bytecode similarity analysis for {contract_address}")
-                
-                # Run bytecode similarity analysis
-                bytecode_results = await self.bytecode_engine.analyze_bytecode_similarity(
-                    bytecode=sample_bytecode,
-                    include_opcode_analysis=True,
-                    include_vulnerability_patterns=True,
-                    include_fingerprinting=True
-                )
-                
-                # Update progress
-                self.active_scans[job_id]["progress"] = 90
+                scan_status["progress"] = 90
                 
                 # Convert bytecode analysis results to vulnerability findings format
-                vulnerabilities = []
+                location = f"Contract {contract_address}"
                 
-                # Add vulnerability patterns found
-                for pattern in bytecode_results["vulnerability_patterns"]:
-                    vulnerabilities.append({
-                        "type": pattern["pattern_type"],
-                        "severity": pattern["severity"].lower(),
+                # Add vulnerability patterns found. Results are unpickled from a
+                # worker process, so the few distinct type and severity values
+                # arrive as fresh strings; intern them so retained findings
+                # share one copy
+                vulnerabilities = [
+                    {
+                        "type": sys.intern(pattern["vulnerability_type"]),
+                        "severity": sys.intern(pattern["severity"].lower()),
                         "description": f"Bytecode pattern detected: {pattern['description']}",
-                        "location": f"Contract {contract_address}",
+                        "location": location,
                         "code_snippet": "Bytecode analysis",
-                        "recommendation": pattern["recommendation"],
-                        "id": f"bytecode_{pattern['pattern_id']}",
-                        "confidence": pattern["confidence"],
-                        "economic_impact": 0.0
-                    })
+                        "recommendation": f"Review the contract for {pattern['vulnerability_type'].replace('_', ' ')} issues",
+                        "id": f"bytecode_{pattern['vulnerability_type']}_{pattern['pattern']}",
+                        "confidence": BYTECODE_PATTERN_CONFIDENCE,
+                        **BYTECODE_FINDING_DEFAULTS
+                    }
+                    for pattern in bytecode_results["vulnerability_patterns"]
+                ]
                 
-                # Add findings based on similarity matches
-                for match in bytecode_results["similarity_matches"]:
-                    if match["confidence"] > 0.8:  # High confidence matches
-                        vulnerabilities.append({
-                            "type": "similarity_pattern",
-                            "severity": "low",
-                            "description": f"High similarity to {match['pattern_name']} (confidence: {match['confidence']:.2f})",
-                            "location": f"Contract {contract_address}",
-                            "code_snippet": "Bytecode similarity analysis",
-                            "recommendation": f"Review contract for {match['pattern_name']} patterns",
-                            "id": f"similarity_{match['pattern_name']}",
-                            "confidence": match["confidence"],
-                            "economic_impact": 0.0
-                        })
+                # Add findings based on high confidence similarity matches
+                vulnerabilities.extend(
+                    {
+                        "type": "similarity_pattern",
+                        "severity": "low",
+                        "description": f"High similarity to {match['pattern_name']} (confidence: {match['confidence']:.2f})",
+                        "location": location,
+                        "code_snippet": "Bytecode similarity analysis",
+                        "recommendation": f"Review contract for {match['pattern_name']} patterns",
+                        "id": f"similarity_{match['pattern_name']}",
+                        "confidence": match["confidence"],
+                        **BYTECODE_FINDING_DEFAULTS
+                    }
+                    for match in bytecode_results["similarity_matches"]
+                    if match["confidence"] > 0.8
+                )
                 
                 # Add findings based on opcode analysis
-                opcode_analysis = bytecode_results["opcode_analysis"]
-                if opcode_analysis.get("suspicious_opcodes"):
-                    for opcode in opcode_analysis["suspicious_opcodes"]:
-                        vulnerabilities.append({
-                            "type": "suspicious_opcode",
-                            "severity": "medium",
-                            "description": f"Suspicious opcode detected: {opcode}",
-                            "location": f"Contract {contract_address}",
-                            "code_snippet": "Opcode analysis",
-                            "recommendation": f"Review usage of {opcode} opcode for potential security issues",
-                            "id": f"opcode_{opcode}",
-                            "confidence": 0.7,
-                            "economic_impact": 0.0
-                        })
+                vulnerabilities.extend(
+                    {
+                        "type": "suspicious_opcode",
+                        "severity": "medium",
+                        "description": f"Suspicious opcode detected: {opcode}",
+                        "location": location,
+                        "code_snippet": "Opcode analysis",
+                        "recommendation": f"Review usage of {opcode} opcode for potential security issues",
+                        "id": f"opcode_{opcode}",
+                        "confidence": 0.7,
+                        **BYTECODE_FINDING_DEFAULTS
+                    }
+                    for opcode in bytecode_results["opcode_analysis"].get("suspicious_opcodes") or ()
+                )
                 
                 # Calculate risk score based on bytecode analysis
                 risk_score = bytecode_results["risk_score"]
                 
                 # Update scan results
-                self.active_scans[job_id].update({
-                    "status": "completed",
-                    "progress": 100,
+                self._finish_scan(job_id, "completed", {
                     "vulnerabilities": vulnerabilities,
                     "risk_score": risk_score,
                     "total_vulnerabilities": len(vulnerabilities),
                     "analysis_duration": 3.0,
                     "engines_used": ["bytecode_similarity_engine"],
                     "bytecode_analysis": bytecode_results,
-                    "end_time": datetime.utcnow()
+                    "end_time": datetime.now(UTC)
                 })
                 
-                logger.info(f"Bytecode analysis completed for {contract_address}: {len(vulnerabilities)} findings")
+                logger.info("Bytecode analysis completed for %s: %d findings", contract_address, len(vulnerabilities))
                 
             except Exception as e:
-                logger.error(f"Failed to fetch/analyze bytecode for {contract_address}: {e}")
+                logger.error("Failed to fetch/analyze bytecode for %s: %s", contract_address, e)
                 
                 # Fallback to basic analysis
                 mock_findings = [
@@ -219,37 +271,155 @@ class ScorpiusEngine:
                     }
                 ]
                 
-                self.active_scans[job_id].update({
-                    "status": "completed",
-                    "progress": 100,
+                self._finish_scan(job_id, "completed", {
                     "vulnerabilities": mock_findings,
                     "risk_score": 1.0,
                     "total_vulnerabilities": len(mock_findings),
                     "analysis_duration": 1.0,
                     "engines_used": ["basic_analyzer"],
-                    "end_time": datetime.utcnow(),
+                    "end_time": datetime.now(UTC),
                     "warning": "Bytecode analysis failed, basic analysis performed"
                 })
                 
         except Exception as e:
-            logger.error(f"Blockchain analysis failed for {job_id}: {e}")
+            logger.error("Blockchain analysis failed for %s: %s", job_id, e)
             raise
     
+    async def analyze_bytecode_batch(self, contract_addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch bytecode for many contracts in one JSON-RPC batch and run the
+        similarity analysis for all of them concurrently.
+        
+        Args:
+            contract_addresses: Addresses of deployed contracts
+            
+        Returns:
+            Bytecode analysis results keyed by contract address
+        """
+        bytecodes = await self._fetch_bytecodes(contract_addresses)
+        
+        # Each contract is analyzed in a worker process so the event loop
+        # stays free and several contracts use several cores
+        loop = asyncio.get_running_loop()
+        cpu_pool = self._get_cpu_pool()
+        analyses = await asyncio.gather(*[
+            loop.run_in_executor(cpu_pool, analyze_bytecode_sync, bytecodes[address])
+            for address in contract_addresses
+        ])
+        return dict(zip(contract_addresses, analyses))
+    
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        """Create the bytecode analysis process pool on first use."""
+        if self._cpu_pool is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            self._cpu_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._cpu_pool
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP client on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=128, limit_per_host=16, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._http
+    
+    async def start(self) -> None:
+        """Open the shared HTTP client; call from the application's startup hook."""
+        self._get_http()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client and shut down the bytecode analysis process pool."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+    
+    async def _fetch_bytecodes(self, contract_addresses: List[str]) -> Dict[str, str]:
+        """
+        Fetch deployed bytecode with a single batched eth_getCode request.
+        
+        Raises:
+            ValueError: If the node returns an error or an address has no code
+        """
+        if not ETHEREUM_RPC_URL:
+            logger.warning("ETHEREUM_RPC_URL not set, analyzing sample bytecode")
+            return {address: SAMPLE_BYTECODE for address in contract_addresses}
+        
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_getCode", "params": [address, "latest"]}
+            for i, address in enumerate(contract_addresses)
+        ]
+        async with self._get_http().post(ETHEREUM_RPC_URL, json=batch) as response:
+            response.raise_for_status()
+            replies = await response.json()
+        
+        # Batch replies may come back in any order; pair them by id
+        bytecodes: Dict[str, str] = {}
+        for reply in replies:
+            address = contract_addresses[reply["id"]]
+            if "error" in reply:
+                raise ValueError(f"eth_getCode failed for {address}: {reply['error']}")
+            code = reply.get("result") or "0x"
+            if code == "0x":
+                raise ValueError(f"No contract code deployed at {address}")
+            bytecodes[address] = code
+        
+        missing = [address for address in contract_addresses if address not in bytecodes]
+        if missing:
+            raise ValueError(f"No eth_getCode reply for {', '.join(missing)}")
+        return bytecodes
+    
+    def _finish_scan(self, job_id: str, status: str, details: Dict[str, Any]) -> None:
+        """Record a terminal status and the scan's result payload."""
+        scan_status = self._status.get(job_id)
+        if scan_status is None:
+            # Running scans are never evicted; this only guards unknown job ids
+            return
+        scan_status["status"] = status
+        if status == "completed":
+            scan_status["progress"] = 100
+        self._details[job_id] = details
+    
+    def _evict_finished_scans(self) -> None:
+        """Drop the oldest finished scans once more than _max_scans are tracked."""
+        excess = len(self._status) - self._max_scans
+        if excess <= 0:
+            return
+        
+        evicted = []
+        for job_id, scan_status in self._status.items():
+            if scan_status["status"] not in ACTIVE_SCAN_STATUSES:
+                evicted.append(job_id)
+                if len(evicted) == excess:
+                    break
+        
+        for job_id in evicted:
+            del self._status[job_id]
+            self._details.pop(job_id, None)
+    
     def get_scan_status(self, job_id: str) -> Dict[str, Any]:
         """Get the current status of a scan job."""
-        if job_id not in self.active_scans:
+        scan_status = self._status.get(job_id)
+        if scan_status is None:
             raise ValueError(f"Scan job {job_id} not found")
         
-        return self.active_scans[job_id]
+        details = self._details.get(job_id)
+        return {**scan_status, **details} if details else dict(scan_status)
     
     def list_scans(self, status_filter: str = None) -> List[Dict[str, Any]]:
         """List all scans, optionally filtered by status."""
-        scans = list(self.active_scans.values())
-        
-        if status_filter:
-            scans = [scan for scan in scans if scan.get("status") == status_filter]
-        
-        return scans
+        # Filter on the small status records; merge results only for matches
+        return [
+            self.get_scan_status(job_id)
+            for job_id, scan_status in self._status.items()
+            if not status_filter or scan_status["status"] == status_filter
+        ]
 
     async def analyze_honeypot_infrastructure(
         self,
@@ -267,18 +437,13 @@ class ScorpiusEngine:
             Dict containing honeypot analysis results
         """
         if analysis_options is None:
-            analysis_options = {
-                "include_service_detection": True,
-                "include_behavioral_analysis": True,
-                "include_timing_analysis": True,
-                "ports": None  # Use default ports
-            }
+            analysis_options = DEFAULT_HONEYPOT_OPTIONS
         
-        logger.info(f"Starting honeypot infrastructure analysis for {len(targets)} targets")
+        logger.info("Starting honeypot infrastructure analysis for %d targets", len(targets))
         
         results = {
-            "analysis_id": str(uuid.uuid4()),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "analysis_id": uuid.uuid4().hex,
+            "timestamp": datetime.now(UTC).isoformat(),
             "targets_analyzed": len(targets),
             "target_results": [],
             "summary": {
@@ -289,78 +454,144 @@ class ScorpiusEngine:
             }
         }
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        try:
-            # Analyze each target
-            for target in targets:
+        # Probes are network-bound, so targets run concurrently up to a cap
+        semaphore = asyncio.BoundedSemaphore(analysis_options.get("max_concurrency", 16))
+        
+        async def _analyze_one(index: int, target: str):
+            async with semaphore:
+                logger.debug("Analyzing target: %s", target)
                 try:
-                    logger.info(f"Analyzing target: {target}")
-                    
-                    target_analysis = await self.honeypot_detector.analyze_target(
+                    analysis = await self._cached_analyze_target(
                         target=target,
                         ports=analysis_options.get("ports"),
                         include_service_detection=analysis_options.get("include_service_detection", True),
                         include_behavioral_analysis=analysis_options.get("include_behavioral_analysis", True),
                         include_timing_analysis=analysis_options.get("include_timing_analysis", True)
                     )
-                    
-                    # Categorize result
-                    detection_count = len(target_analysis.get("honeypot_detections", []))
-                    confidence = target_analysis.get("confidence", 0.0)
-                    risk_score = target_analysis.get("risk_score", 0.0)
-                    
-                    category = "clean"
-                    if detection_count > 0:
-                        if confidence >= 0.8:
-                            category = "confirmed_honeypot"
-                            results["summary"]["high_confidence_detections"] += 1
-                        elif confidence >= 0.5:
-                            category = "likely_honeypot"
-                        else:
-                            category = "suspicious"
-                        
-                        results["summary"]["total_honeypots_detected"] += 1
-                        
-                        if risk_score >= 5.0:
-                            results["summary"]["suspicious_targets"] += 1
-                    
-                    results["target_results"].append({
-                        "target": target,
-                        "category": category,
-                        "analysis": target_analysis
-                    })
-                    
+                    return index, target, analysis, None
                 except Exception as e:
-                    logger.error(f"Failed to analyze target {target}: {e}")
-                    results["target_results"].append({
+                    return index, target, None, e
+        
+        try:
+            # Results keep the input order even though targets finish out of order
+            target_results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+            completed_analyses = 0
+            tasks = [
+                asyncio.create_task(_analyze_one(index, target))
+                for index, target in enumerate(targets)
+            ]
+            
+            for next_done in asyncio.as_completed(tasks):
+                index, target, target_analysis, error = await next_done
+                
+                if error is not None:
+                    logger.error("Failed to analyze target %s: %s", target, error)
+                    target_results[index] = {
                         "target": target,
                         "category": "error",
-                        "error": str(e)
-                    })
+                        "error": str(error)
+                    }
+                    continue
+                
+                completed_analyses += 1
+                
+                # Categorize result
+                detection_count = len(target_analysis.get("honeypot_detections", []))
+                confidence = target_analysis.get("confidence", 0.0)
+                risk_score = target_analysis.get("risk_score", 0.0)
+                
+                category = "clean"
+                if detection_count > 0:
+                    band = bisect.bisect_right(HONEYPOT_CONFIDENCE_THRESHOLDS, confidence)
+                    category = HONEYPOT_CATEGORIES[band]
+                    if band == len(HONEYPOT_CONFIDENCE_THRESHOLDS):
+                        results["summary"]["high_confidence_detections"] += 1
+                    
+                    results["summary"]["total_honeypots_detected"] += 1
+                    
+                    if risk_score >= 5.0:
+                        results["summary"]["suspicious_targets"] += 1
+                
+                target_results[index] = {
+                    "target": target,
+                    "category": category,
+                    "analysis": target_analysis
+                }
+            
+            results["target_results"] = target_results
             
             # Calculate summary statistics
-            total_time = time.time() - start_time
+            total_time = time.monotonic() - start_time
             results["summary"]["analysis_time"] = round(total_time, 2)
             
             # Detection rate
-            completed_analyses = sum(1 for r in results["target_results"] if r["category"] != "error")
             if completed_analyses > 0:
                 detection_rate = (results["summary"]["total_honeypots_detected"] / completed_analyses) * 100
                 results["summary"]["detection_rate"] = round(detection_rate, 2)
             else:
                 results["summary"]["detection_rate"] = 0.0
             
-            logger.info(f"Honeypot infrastructure analysis completed. "
-                       f"Detected {results['summary']['total_honeypots_detected']} honeypots "
-                       f"out of {completed_analyses} analyzed targets")
+            logger.info("Honeypot infrastructure analysis completed. "
+                        "Detected %d honeypots out of %d analyzed targets",
+                        results["summary"]["total_honeypots_detected"], completed_analyses)
             
         except Exception as e:
-            logger.error(f"Honeypot infrastructure analysis failed: {e}")
+            logger.error("Honeypot infrastructure analysis failed: %s", e)
             results["error"] = str(e)
         
         return results
 
+    async def _cached_analyze_target(
+        self,
+        target: str,
+        ports: Optional[Sequence[int]],
+        include_service_detection: bool,
+        include_behavioral_analysis: bool,
+        include_timing_analysis: bool
+    ) -> Dict[str, Any]:
+        """
+        Run honeypot_detector.analyze_target, reusing a result for the same
+        target, ports and probe flags for HONEYPOT_CACHE_TTL_SECONDS.
+        Failures are not cached.
+        """
+        key = (
+            target,
+            tuple(sorted(ports)) if ports else None,
+            (include_service_detection, include_behavioral_analysis, include_timing_analysis)
+        )
+        now = time.monotonic()
+        
+        cached = self._hp_cache.get(key)
+        if cached is not None and now - cached[0] < HONEYPOT_CACHE_TTL_SECONDS:
+            return copy.deepcopy(cached[1])
+        
+        analysis = await self.honeypot_detector.analyze_target(
+            target=target,
+            ports=ports,
+            include_service_detection=include_service_detection,
+            include_behavioral_analysis=include_behavioral_analysis,
+            include_timing_analysis=include_timing_analysis
+        )
+        
+        if len(self._hp_cache) >= HONEYPOT_CACHE_MAX_ENTRIES:
+            self._prune_hp_cache(now)
+        self._hp_cache[key] = (time.monotonic(), copy.deepcopy(analysis))
+        return analysis
+    
+    def _prune_hp_cache(self, now: float) -> None:
+        """Drop expired honeypot results, then the oldest if still full."""
+        expired = [
+            key for key, (stored_at, _) in self._hp_cache.items()
+            if now - stored_at >= HONEYPOT_CACHE_TTL_SECONDS
+        ]
+        for key in expired:
+            del self._hp_cache[key]
+        
+        while len(self._hp_cache) >= HONEYPOT_CACHE_MAX_ENTRIES:
+            del self._hp_cache[next(iter(self._hp_cache))]
+    
     async def quick_honeypot_scan(self, target: str) -> Dict[str, Any]:
         """
         Perform a quick honeypot scan on a single target.
@@ -371,15 +602,13 @@ class ScorpiusEngine:
         Returns:
             Dict containing quick scan results
         """
-        logger.info(f"Starting quick honeypot scan for target: {target}")
+        logger.info("Starting quick honeypot scan for target: %s", target)
         
         try:
             # Quick scan with common honeypot ports
-            common_ports = [21, 22, 23, 80, 443, 2222, 8080]
-            
-            results = await self.honeypot_detector.analyze_target(
+            results = await self._cached_analyze_target(
                 target=target,
-                ports=common_ports,
+                ports=COMMON_HONEYPOT_PORTS,
                 include_service_detection=True,
                 include_behavioral_analysis=False,  # Skip for speed
                 include_timing_analysis=False       # Skip for speed
@@ -392,12 +621,8 @@ class ScorpiusEngine:
             
             # Determine threat level
             if honeypot_detected:
-                if confidence >= 0.8:
-                    threat_level = "HIGH"
-                elif confidence >= 0.5:
-                    threat_level = "MEDIUM"
-                else:
-                    threat_level = "LOW"
+                band = bisect.bisect_right(HONEYPOT_CONFIDENCE_THRESHOLDS, confidence)
+                threat_level = HONEYPOT_THREAT_LEVELS[band]
             else:
                 threat_level = "NONE"
             
@@ -411,11 +636,11 @@ class ScorpiusEngine:
                 "detections_count": len(results.get("honeypot_detections", [])),
                 "top_detections": results.get("honeypot_detections", [])[:3],
                 "analysis_time": results.get("analysis_time", 0.0),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": datetime.now(UTC).isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Quick honeypot scan failed for {target}: {e}")
+            logger.error("Quick honeypot scan failed for %s: %s", target, e)
             return {
                 "target": target,
                 "scan_type": "quick",
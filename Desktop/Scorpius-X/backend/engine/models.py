@@ -1,9 +1,11 @@
 
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Tuple
 from .enums import ScanStatus, SeverityLevel
 
 class Finding(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     title: str
     severity: SeverityLevel
@@ -12,7 +14,9 @@ class Finding(BaseModel):
     location: Optional[str] = None
 
 class ScanJob(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     job_id: str
     contract_address: str
     status: ScanStatus
-    findings: List[Finding] = []
+    findings: Tuple[Finding, ...] = ()
@@ -1,6 +1,27 @@
+import asyncio
+
 from ..engine.engine import ScorpiusEngine
 
 engine = ScorpiusEngine()
 
-def schedule_scan(contract_address: str):
-    return engine.submit_scan(contract_address)
+async def schedule_scan(contract_address: str) -> str:
+    """Submit a scan on the running event loop and return its job id."""
+    return await engine.submit_scan(contract_address)
+
+def schedule_scan_sync(contract_address: str) -> str:
+    """
+    Run a scan to completion for synchronous callers outside any event loop.
+
+    Blocks until the scan finishes and returns its job id. Async callers
+    should await schedule_scan on their own loop instead.
+    """
+    async def run_scan() -> str:
+        try:
+            job_id = await engine.submit_scan(contract_address)
+            # asyncio.run cancels tasks still pending when it closes the loop
+            await engine.wait_for_scan(job_id)
+            return job_id
+        finally:
+            # The HTTP client is bound to this loop
+            await engine.close()
+    return asyncio.run(run_scan())
@@ -2,7 +2,7 @@ import os
 from pathlib import Path
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from api.api_server import router as api_router
+from api.api_server import router as api_router, engine as scan_engine
 from ws.websocket_handler import handler as ws_handler
 from routes.time_machine_routes import router as time_machine_router
 from routes.scorpius_routes import router as scorpius_router
@@ -11,6 +11,7 @@ from routes.training_routes import router as training_router
 from routes.scheduler_routes import router as scheduler_router
 from routes.autonomous_exploit_routes import router as autonomous_exploit_router
 from core.db import engine, Base
+from core.scorpius.ai_analyzer import ClaudeAnalyzer
 
 # Load environment variables from .env file
 env_file = Path(__file__).parent / ".env"
@@ -59,3 +60,13 @@ async def websocket_endpoint(ws: WebSocket):
 @app.get("/")
 def health_check():
     return {"status": "OK", "detail": "Scorpius Backend is running!"}
+
+# ─── 5) Open shared HTTP clients on startup, release them on shutdown ───────
+@app.on_event("startup")
+async def startup_event():
+    await scan_engine.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await ClaudeAnalyzer.aclose()
+    await scan_engine.close()
@@ -3,12 +3,15 @@ Elite Mempool System - Main Launcher
 This is the primary entry point for the Elite Mempool System.
 """
 import asyncio
+import atexit
 import logging
+import queue
 import signal
 import sys
 import time
 from typing import Dict, Any, Optional
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Add the project directory to Python path for imports
 project_dir = Path(__file__).parent
@@ -80,13 +83,33 @@ class EliteMempoolSystem:
         """Setup system logging configuration."""
         log_level = self.config.get("log_level", "INFO")
         
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        stream_handler = logging.StreamHandler(sys.stdout)
+        file_handler = RotatingFileHandler(
+            'elite_mempool_system.log',
+            maxBytes=10 * 1024 * 1024,
+            backupCount=5,
+            delay=True
+        )
+        for handler in (stream_handler, file_handler):
+            handler.setFormatter(formatter)
+        
+        # Call sites only enqueue records; a single listener thread does the
+        # console and file writes so logging never blocks the event loop
+        log_queue: queue.Queue = queue.Queue(-1)
+        self._log_listener = QueueListener(
+            log_queue, stream_handler, file_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        # Only the message is merged on enqueue; the listener adds timestamps
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
         logging.basicConfig(
             level=getattr(logging, log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('elite_mempool_system.log')
-            ]
+            handlers=[queue_handler]
         )
         
         # Set specific logger levels
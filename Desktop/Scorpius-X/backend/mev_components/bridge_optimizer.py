@@ -1,11 +1,50 @@
 # bridge_optimizer.py
 import logging
+import numpy as np
 
 class BridgeOptimizer:
+    DEFAULT_LATENCY_WEIGHT = 0.0
+    DEFAULT_SLIPPAGE_WEIGHT = 1.0
+
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-    
+        self.latency_weight = float(config.get('BRIDGE_LATENCY_WEIGHT', self.DEFAULT_LATENCY_WEIGHT))
+        self.slippage_weight = float(config.get('BRIDGE_SLIPPAGE_WEIGHT', self.DEFAULT_SLIPPAGE_WEIGHT))
+
     def optimize(self, bridge_data):
-        self.logger.info("Optimizing bridge routes (placeholder).")
-        return bridge_data
+        """
+        Pick the cheapest route for moving `amount` across a bridge.
+
+        bridge_data is {"amount": float, "routes": [{"bridge": str, "fee_bps": float,
+        "latency_s": float, "liquidity": float}, ...]}. Route cost is the fee,
+        plus latency and a slippage term (amount**2 / liquidity), each scaled
+        by its configured weight. Returns the cheapest route dict, or None if
+        there are no routes or none of them has liquidity.
+        """
+        routes = bridge_data.get("routes") or []
+        if not routes:
+            self.logger.warning("No bridge routes to optimize.")
+            return None
+        amount = float(bridge_data.get("amount", 0.0))
+
+        # Columns: fee_bps, latency_s, liquidity
+        params = np.array(
+            [(r["fee_bps"], r["latency_s"], r["liquidity"]) for r in routes],
+            dtype=np.float64,
+        )
+        fees, lats, liqs = params.T
+        # Slippage is only defined for routes with liquidity; dry routes are
+        # masked out after weighting, since a zero weight times inf is NaN
+        has_liquidity = liqs > 0
+        slippage = amount * amount / np.where(has_liquidity, liqs, 1.0)
+        cost = amount * fees / 10_000 + self.latency_weight * lats + self.slippage_weight * slippage
+        cost[~has_liquidity] = np.inf
+
+        best = int(cost.argmin())
+        if not np.isfinite(cost[best]):
+            self.logger.warning(f"None of the {len(routes)} bridge routes has liquidity.")
+            return None
+        self.logger.debug(f"Selected bridge route {routes[best].get('bridge')} (cost {cost[best]:.6f}) "
+                          f"from {len(routes)} candidates.")
+        return routes[best]
@@ -80,6 +80,8 @@ class ConfigManager:
             'SIMULATION_RPC': os.getenv('SIMULATION_RPC', 'http://localhost:8545'), # RPC for Anvil/REVM simulator
             'CCIP_ROUTER_ADDRESSES': {}, # Add chain_id: address mapping
             'SUPPORTED_BRIDGES': {}, # Add bridge configurations for BridgeOptimizer
+            'BRIDGE_LATENCY_WEIGHT': 0.0, # BridgeOptimizer cost per second of bridge latency
+            'BRIDGE_SLIPPAGE_WEIGHT': 1.0, # BridgeOptimizer multiplier on amount**2 / liquidity
             'NETWORK_NAME': 'mainnet', # Network name for Defender
             # Add other specific contract addresses if needed
             # 'AAVE_LENDING_POOL': '0x...',
@@ -1,19 +1,204 @@
 import asyncio
-import json
+import functools
 import logging
 import os
-import subprocess
-import time
-from typing import Dict
+from collections.abc import Mapping
+from typing import Awaitable, Dict, List, Optional, Set, Tuple
 
 import aiohttp
-import numpy as np
-from web3 import Web3
+import orjson
+from eth_abi import decode, encode
+from eth_abi.registry import registry as abi_registry
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
 from web3.exceptions import ContractLogicError
 
+from tx_cache import GAS_PRICE_TTL, GasPriceCache, NonceManager
+
 logger = logging.getLogger("EnhancedCrossChainExecutor")
 logger.setLevel(logging.DEBUG)
 
+# Native-asset sentinel used for feeToken and balance lookups
+ZERO_ADDR = "0x0000000000000000000000000000000000000000"
+
+@functools.lru_cache(maxsize=8192)
+def _cs(address: str) -> str:
+    """Checksum an address once; to_checksum_address hashes the address on every call."""
+    return Web3.to_checksum_address(address)
+
+def _hex_to_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value[:2] in ('0x', '0X') else value)
+
+# Keep-alive pool shared by every request to one RPC endpoint. CCIP_POOL_SIZE
+# caps total connections; raise it when many swaps are sent concurrently
+RPC_POOL_LIMIT = int(os.environ.get("CCIP_POOL_SIZE", "256"))
+RPC_POOL_LIMIT_PER_HOST = 64
+RPC_DNS_CACHE_TTL = 300
+RPC_KEEPALIVE_TIMEOUT = 60
+
+def _rpc_json_default(value):
+    # Same conversions as web3's Web3JsonEncoder for what orjson can't encode natively
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + bytes(value).hex()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider backed by one pooled aiohttp session per endpoint.
+
+    The session is created on the first request (or by open_session) and is
+    registered in web3's per-endpoint session cache, so repeated calls reuse
+    warm TCP/TLS connections instead of handshaking each time.
+    """
+    def __init__(self, endpoint_uri: str, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def open_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=RPC_POOL_LIMIT,
+                    limit_per_host=RPC_POOL_LIMIT_PER_HOST,
+                    ttl_dns_cache=RPC_DNS_CACHE_TTL,
+                    keepalive_timeout=RPC_KEEPALIVE_TIMEOUT
+                ),
+                raise_for_status=True
+            )
+            cached = await self.cache_async_session(session)
+            if cached is not session:
+                # web3 already holds a session for this endpoint; use that one
+                await session.close()
+            self._session = cached
+        return self._session
+
+    async def close_session(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def make_request(self, method, params):
+        if self._session is None or self._session.closed:
+            await self.open_session()
+        return await super().make_request(method, params)
+
+    # JSON-RPC bodies go through orjson instead of the stdlib json encoder/decoder
+    def encode_rpc_request(self, method, params) -> bytes:
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_rpc_json_default)
+        except orjson.JSONEncodeError:
+            # orjson only handles 64-bit integers; let web3's encoder take the rest
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response: bytes):
+        return orjson.loads(raw_response)
+
+def make_async_web3(endpoint_uri: str) -> AsyncWeb3:
+    """Build an AsyncWeb3 client over a pooled HTTP provider for use as a w3_providers entry."""
+    return AsyncWeb3(PooledAsyncHTTPProvider(endpoint_uri))
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL_BATCH_WINDOW = 0.05  # seconds reads wait for company before dispatch
+AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+GET_ETH_BALANCE_SELECTOR = Web3.keccak(text="getEthBalance(address)")[:4]
+
+# Only balanceOf is needed from fee-token contracts
+_ERC20_BALANCEOF_ABI = (
+    {"constant": True, "inputs": [{"name": "_owner", "type": "address"}], "name": "balanceOf", "outputs": [{"name": "balance", "type": "uint256"}], "type": "function"},
+)
+
+# Call the CCIP receiver contract runs on the destination chain
+EXECUTE_SWAP_SELECTOR = Web3.keccak(text="executeSwap(address,uint256,address,uint256)")[:4]
+
+# Client.EVM2AnyMessage: (receiver, data, tokenAmounts, feeToken, extraArgs)
+EVM2ANY_MESSAGE_TYPE = "(bytes,bytes,(address,uint256)[],address,bytes)"
+CCIP_SEND_SELECTOR = Web3.keccak(text=f"ccipSend(uint64,{EVM2ANY_MESSAGE_TYPE})")[:4]
+GET_FEE_SELECTOR = Web3.keccak(text=f"getFee(uint64,{EVM2ANY_MESSAGE_TYPE})")[:4]
+# Encoder for the (destinationChainSelector, message) arguments of both router
+# calls, resolved from the ABI registry once instead of per encode
+_ROUTER_ARGS_ENCODER = abi_registry.get_encoder(f"(uint64,{EVM2ANY_MESSAGE_TYPE})")
+
+# OnRamp event carrying the outgoing message (Internal.EVM2EVMMessage, CCIP v1.2+);
+# the message id is the struct's last field
+EVM2EVM_MESSAGE_TYPE = (
+    "(uint64,address,address,uint64,uint256,bool,uint64,address,uint256,"
+    "bytes,(address,uint256)[],bytes[],bytes32)"
+)
+CCIP_SEND_REQUESTED_TOPIC = Web3.keccak(text=f"CCIPSendRequested({EVM2EVM_MESSAGE_TYPE})")
+CCIP_RECEIPT_TIMEOUT = 120  # seconds
+
+@functools.lru_cache(maxsize=None)
+def _load_abi(filename: str) -> list:
+    """Load an ABI from the abis/ directory once per process; callers must not mutate it."""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    abi_path = os.path.join(base_dir, "abis", filename)
+    with open(abi_path, "rb") as f:
+        return orjson.loads(f.read())
+
+class MulticallBatcher:
+    """
+    Coalesces eth_call reads on one chain into a single Multicall3 aggregate3 call.
+
+    Reads queued within `window` seconds of the first one go out together in
+    one RPC round-trip; each caller gets back its own raw return data, or a
+    ContractLogicError if its sub-call reverted. A window holding a single
+    read is sent as a plain eth_call.
+    """
+    def __init__(self, w3: AsyncWeb3, window: float = MULTICALL_BATCH_WINDOW):
+        self.w3 = w3
+        self.window = window
+        self._pending: List[Tuple[str, bytes, asyncio.Future]] = []
+        # The event loop only holds weak references to tasks; keep in-flight
+        # flushes alive until they finish. A new window can open while the
+        # previous batch's RPC is still running, so there may be more than one
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def call(self, target: str, call_data: bytes) -> bytes:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((target, call_data, future))
+        if len(self._pending) == 1:
+            task = asyncio.create_task(self._flush_after_window())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.window)
+        batch, self._pending = self._pending, []
+        try:
+            if len(batch) == 1:
+                target, call_data, _ = batch[0]
+                results = [(True, await self.w3.eth.call({'to': target, 'data': call_data}))]
+            else:
+                calls = [(target, True, call_data) for target, call_data, _ in batch]
+                raw = await self.w3.eth.call({
+                    'to': MULTICALL3_ADDRESS,
+                    'data': AGGREGATE3_SELECTOR + encode(['(address,bool,bytes)[]'], [calls])
+                })
+                results, = decode(['(bool,bytes)[]'], raw)
+                self.logger.debug(f"Multicall3 batch of {len(batch)} reads dispatched.")
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (target, _, future), (success, return_data) in zip(batch, results):
+            if future.done():
+                continue  # Caller gave up waiting
+            if success:
+                future.set_result(bytes(return_data))
+            else:
+                future.set_exception(ContractLogicError(f"Multicall3 sub-call to {target} reverted"))
+
 class EnhancedCrossChainExecutor:
     """
     Enhanced Cross-Chain Executor
@@ -28,17 +213,25 @@ class EnhancedCrossChainExecutor:
       - config['CCIP_ROUTERS'] must be provided for each supported chain.
       - config should include any required keys for balance checks (if implemented).
       
-    Assumes that you have a dictionary of Web3 providers for each supported chain available
-    in self.w3_providers.
+    Assumes that you have a dictionary of AsyncWeb3 clients for each supported chain available
+    in self.w3_providers (see make_async_web3). Use the executor as an async context manager,
+    or call aclose(), to release the pooled RPC sessions.
     """
-    def __init__(self, config: dict, w3_providers: Dict[int, Web3]):
+    # (source chain id, destination chain id) lanes the executor will route
+    SUPPORTED_CHAIN_PAIRS = frozenset({
+        (1, 137), (1, 42161),
+        (137, 1), (137, 42161),
+        (42161, 1), (42161, 137)
+    })
+
+    def __init__(self, config: dict, w3_providers: Dict[int, AsyncWeb3]):
         self.config = config
-        self.w3_providers = w3_providers  # e.g., { 1: Web3(provider_for_mainnet), 137: provider_for_polygon, ... }
+        self.w3_providers = w3_providers  # e.g., { 1: make_async_web3(mainnet_rpc), 137: make_async_web3(polygon_rpc), ... }
         self.logger = logging.getLogger(self.__class__.__name__)
         # Load verified CCIP ABIs
         self.ccip_abis = {
-            'router': self._load_abi('CCIPRouter.json'),
-            'token_pool': self._load_abi('TokenPool.json')
+            'router': _load_abi('CCIPRouter.json'),
+            'token_pool': _load_abi('TokenPool.json')
         }
         # Predefined chain selectors (from Chainlink documentation, for example)
         self.chain_selectors = {
@@ -49,12 +242,65 @@ class EnhancedCrossChainExecutor:
         # This will be populated with contract instances per chain
         self.ccip_contracts = {}
         self._initialize_all_ccip_contracts()
+        # Per-chain read batchers, created on first use
+        self._multicall: Dict[int, MulticallBatcher] = {}
+        # Encoded balance reads, (target, calldata), keyed by (chain id, token
+        # address as given, account)
+        self._balance_calls: Dict[Tuple[int, str, str], Tuple[str, bytes]] = {}
+        # Per-chain sender nonce and gas price, tracked locally between sends
+        self._nonces: Dict[int, NonceManager] = {}
+        self._gas_prices: Dict[int, GasPriceCache] = {}
+        # Node-reported chain id per provider, fetched once for transaction signing
+        self._chain_ids: Dict[int, int] = {}
+
+    def _batcher(self, chain_id: int) -> MulticallBatcher:
+        batcher = self._multicall.get(chain_id)
+        if batcher is None:
+            batcher = self._multicall[chain_id] = MulticallBatcher(
+                self.w3_providers[chain_id],
+                window=self.config.get('MULTICALL_BATCH_WINDOW', MULTICALL_BATCH_WINDOW)
+            )
+        return batcher
+
+    def _nonce_manager(self, chain_id: int) -> NonceManager:
+        nonces = self._nonces.get(chain_id)
+        if nonces is None:
+            w3 = self.w3_providers[chain_id]
+            nonces = self._nonces[chain_id] = NonceManager(
+                lambda: w3.eth.get_transaction_count(w3.eth.default_account, 'pending')
+            )
+        return nonces
+
+    def _gas_price_cache(self, chain_id: int) -> GasPriceCache:
+        gas_prices = self._gas_prices.get(chain_id)
+        if gas_prices is None:
+            w3 = self.w3_providers[chain_id]
+            gas_prices = self._gas_prices[chain_id] = GasPriceCache(
+                lambda: w3.eth.gas_price,
+                ttl=self.config.get('GAS_PRICE_CACHE_TTL', GAS_PRICE_TTL)
+            )
+        return gas_prices
+
+    async def _chain_id(self, chain_id: int) -> int:
+        value = self._chain_ids.get(chain_id)
+        if value is None:
+            value = self._chain_ids[chain_id] = await self.w3_providers[chain_id].eth.chain_id
+        return value
+
+    async def __aenter__(self):
+        for w3 in self.w3_providers.values():
+            if isinstance(w3.provider, PooledAsyncHTTPProvider):
+                await w3.provider.open_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
-    def _load_abi(self, filename: str) -> dict:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        abi_path = os.path.join(base_dir, "abis", filename)
-        with open(abi_path, "r") as f:
-            return json.load(f)
+    async def aclose(self):
+        """Close the pooled RPC sessions of all chain providers."""
+        for w3 in self.w3_providers.values():
+            if isinstance(w3.provider, PooledAsyncHTTPProvider):
+                await w3.provider.close_session()
 
     def _initialize_all_ccip_contracts(self):
         """
@@ -65,7 +311,7 @@ class EnhancedCrossChainExecutor:
             chain_id = int(chain_id_str)
             if chain_id in self.w3_providers:
                 self.ccip_contracts[chain_id] = self.w3_providers[chain_id].eth.contract(
-                    address=Web3.toChecksumAddress(router_address),
+                    address=_cs(router_address),
                     abi=self.ccip_abis['router']
                 )
                 self.logger.info(f"Initialized CCIP router for chain {chain_id} at {router_address}")
@@ -91,40 +337,50 @@ class EnhancedCrossChainExecutor:
         Raises:
             ValueError: If receiver is invalid.
         """
-        if not Web3.isAddress(params['receiver']):
+        if not Web3.is_address(params['receiver']):
             raise ValueError("Invalid receiver address")
         return {
-            'receiver': Web3.toBytes(hexstr=params['receiver']),
+            'receiver': _hex_to_bytes(params['receiver']),
             'data': self._encode_ccip_data(params),
             'tokenAmounts': [{
-                'token': Web3.toBytes(hexstr=params['token']),
+                'token': _hex_to_bytes(params['token']),
                 'amount': params['amount']
             }],
-            'feeToken': params.get('feeToken', '0x0000000000000000000000000000000000000000'),
-            'extraArgs': Web3.toBytes(text='0x')
+            'feeToken': params.get('feeToken', ZERO_ADDR),
+            'extraArgs': Web3.to_bytes(text='0x')
         }
     
     def _encode_ccip_data(self, params: Dict) -> bytes:
         """
         ABI-encode data for CCIP receiver contracts.
         
-        Here we use solidity_keccak to generate a hash as a placeholder.
-        In production, use a full ABI encoder (e.g. eth_abi.encode_abi) to encode 
-        function parameters according to your contract’s expectations.
+        The receiver is expected to execute
+        executeSwap(address token, uint256 amount, address targetToken, uint256 minOutput);
+        the payload is that function's selector followed by its ABI-encoded arguments.
         """
-        # For example, we assume the receiver expects a call to executeSwap(address,uint256,address,uint256)
-        func_selector = Web3.keccak(text='executeSwap(address,uint256,address,uint256)')[:4]
-        encoded = Web3.solidityKeccak(
-            ['bytes4', 'address', 'uint256', 'address', 'uint256'],
+        return EXECUTE_SWAP_SELECTOR + encode(
+            ['address', 'uint256', 'address', 'uint256'],
             [
-                func_selector,
-                params['token'],
+                _cs(params['token']),
                 params['amount'],
-                params['target_token'],
+                _cs(params['target_token']),
                 params['min_output']
             ]
         )
-        return encoded
+
+    @staticmethod
+    def _pack_ccip_message(dest_selector: int, message: Dict) -> bytes:
+        """
+        ABI-encode (destinationChainSelector, message) for the router's
+        getFee/ccipSend; prefix the function selector to get calldata.
+        """
+        return _ROUTER_ARGS_ENCODER((dest_selector, (
+            message['receiver'],
+            message['data'],
+            [(ta['token'], ta['amount']) for ta in message['tokenAmounts']],
+            message['feeToken'],
+            message['extraArgs']
+        )))
 
     async def estimate_ccip_fee(self, source_chain_id: int, dest_chain_id: int, message: Dict) -> int:
         """
@@ -145,22 +401,14 @@ class EnhancedCrossChainExecutor:
         if dest_selector is None:
             raise ValueError(f"No chain selector for destination chain {dest_chain_id}")
         try:
-            fee = await asyncio.to_thread(
-                router.functions.getFee(
-                    dest_selector,
-                    {
-                        'receiver': message['receiver'],
-                        'data': message['data'],
-                        'tokenAmounts': message['tokenAmounts'],
-                        'feeToken': message['feeToken'],
-                        'extraArgs': message['extraArgs']
-                    }
-                ).call
-            )
+            # Quotes for concurrent swaps share one Multicall3 round-trip
+            call_data = GET_FEE_SELECTOR + self._pack_ccip_message(dest_selector, message)
+            raw = await self._batcher(source_chain_id).call(router.address, call_data)
+            fee, = decode(['uint256'], raw)
             return int(fee * 1.1)  # Apply 10% buffer
         except Exception as e:
             self.logger.error(f"Fee estimation failed: {e}")
-            return Web3.toWei(0.01, 'ether')  # Fallback value
+            return Web3.to_wei(0.01, 'ether')  # Fallback value
 
     async def execute_cross_chain_swap(self, params: Dict) -> Dict:
         """
@@ -189,12 +437,20 @@ class EnhancedCrossChainExecutor:
         if not self._validate_chain_support(source_chain, dest_chain):
             return {'success': False, 'error': 'Unsupported chain pair'}
         
-        message = self.build_ccip_message(params)
-        fee = await self.estimate_ccip_fee(source_chain, dest_chain, message)
-        await self._fund_transaction(source_chain, fee, message['feeToken'])
+        # Start the fee-token balance read now so its RPC is in flight while the
+        # message is encoded (and shares a Multicall batch with the fee quote)
+        fee_token = params.get('feeToken', ZERO_ADDR)
+        balance_task = asyncio.create_task(self._get_token_balance(source_chain, fee_token))
+        try:
+            message = self.build_ccip_message(params)
+            fee = await self.estimate_ccip_fee(source_chain, dest_chain, message)
+        except BaseException:
+            balance_task.cancel()
+            raise
+        await self._fund_transaction(source_chain, fee, fee_token, balance_task)
         
         tx_hash = await self._send_ccip_transaction(source_chain, dest_chain, message, fee)
-        msg_id = await self._get_message_id(tx_hash)
+        msg_id = await self._get_message_id(source_chain, tx_hash)
         return {
             'success': True,
             'tx_hash': tx_hash.hex(),
@@ -209,22 +465,22 @@ class EnhancedCrossChainExecutor:
         Returns:
             bool: True if supported, otherwise False.
         """
-        supported_pairs = {
-            1: [137, 42161],
-            137: [1, 42161],
-            42161: [1, 137]
-        }
-        return dest in supported_pairs.get(source, [])
+        return (source, dest) in self.SUPPORTED_CHAIN_PAIRS
     
-    async def _fund_transaction(self, chain_id: int, fee: int, fee_token: str):
+    async def _fund_transaction(self, chain_id: int, fee: int, fee_token: str,
+                                balance_read: Optional[Awaitable[int]] = None):
         """
         Ensure that the sender account has enough funds to cover the CCIP fee.
         If the fee token is not the native asset, also perform a token approval.
+        
+        balance_read, if given, is an already-started read of the fee-token balance.
         """
-        balance = await self._get_token_balance(chain_id, fee_token)
+        if balance_read is None:
+            balance_read = self._get_token_balance(chain_id, fee_token)
+        balance = await balance_read
         if balance < fee:
             raise ValueError(f"Insufficient funds: required {fee}, available {balance}")
-        if fee_token != '0x0000000000000000000000000000000000000000':
+        if fee_token != ZERO_ADDR:
             await self._approve_token_spend(chain_id, fee_token, fee)
     
     async def _get_token_balance(self, chain_id: int, token: str) -> int:
@@ -233,15 +489,23 @@ class EnhancedCrossChainExecutor:
         Placeholder implementation; replace with your actual balance query.
         """
         provider = self.w3_providers[chain_id]
-        # For native asset:
-        if token == '0x0000000000000000000000000000000000000000':
-            return provider.eth.get_balance(provider.eth.defaultAccount)
-        # Otherwise, create a minimal ERC20 contract instance:
-        erc20_abi = [
-            {"constant": True, "inputs": [{"name": "_owner", "type": "address"}], "name": "balanceOf", "outputs": [{"name": "balance", "type": "uint256"}], "type": "function"}
-        ]
-        contract = provider.eth.contract(address=Web3.toChecksumAddress(token), abi=erc20_abi)
-        return contract.functions.balanceOf(provider.eth.defaultAccount).call()
+        account = provider.eth.default_account
+        # Balance reads are batched with other reads on the chain through Multicall3;
+        # each (token, account) read is encoded once and reused
+        key = (chain_id, token, account)
+        balance_call = self._balance_calls.get(key)
+        if balance_call is None:
+            if token == ZERO_ADDR:
+                # For native asset:
+                balance_call = (MULTICALL3_ADDRESS, GET_ETH_BALANCE_SELECTOR + encode(['address'], [account]))
+            else:
+                # Otherwise, use a minimal ERC20 contract instance:
+                contract = provider.eth.contract(address=_cs(token), abi=_ERC20_BALANCEOF_ABI)
+                balance_call = (contract.address, _hex_to_bytes(contract.encodeABI(fn_name='balanceOf', args=[account])))
+            self._balance_calls[key] = balance_call
+        target, call_data = balance_call
+        balance, = decode(['uint256'], await self._batcher(chain_id).call(target, call_data))
+        return balance
     
     async def _approve_token_spend(self, chain_id: int, token: str, amount: int):
         """
@@ -260,26 +524,47 @@ class EnhancedCrossChainExecutor:
         """
         router = self.ccip_contracts[source_chain]
         dest_selector = self.chain_selectors[dest_chain]
-        tx = router.functions.ccipSend(dest_selector, message).buildTransaction({
-            'from': self.w3_providers[source_chain].eth.defaultAccount,
-            'value': fee if message['feeToken'] == '0x0000000000000000000000000000000000000000' else 0,
-            'nonce': self.w3_providers[source_chain].eth.get_transaction_count(self.w3_providers[source_chain].eth.defaultAccount),
-            'gasPrice': self.w3_providers[source_chain].eth.gas_price,
-            'gas': self.config.get('CCIP_GAS_LIMIT', 500000)
-        })
-        signed_tx = self.w3_providers[source_chain].eth.account.sign_transaction(tx, private_key=self.config['PRIVATE_KEY'])
-        tx_hash = self.w3_providers[source_chain].eth.send_raw_transaction(signed_tx.rawTransaction)
+        w3 = self.w3_providers[source_chain]
+        nonces = self._nonce_manager(source_chain)
+        nonce = await nonces.reserve()
+        try:
+            # Calldata is packed directly; every other field is supplied here, so
+            # there is nothing left for build_transaction to fill in
+            tx = {
+                'to': router.address,
+                'data': CCIP_SEND_SELECTOR + self._pack_ccip_message(dest_selector, message),
+                'value': fee if message['feeToken'] == ZERO_ADDR else 0,
+                'nonce': nonce,
+                'gasPrice': await self._gas_price_cache(source_chain).get(),
+                'gas': self.config.get('CCIP_GAS_LIMIT', 500000),
+                'chainId': await self._chain_id(source_chain)
+            }
+            signed_tx = w3.eth.account.sign_transaction(tx, private_key=self.config['PRIVATE_KEY'])
+            tx_hash = await w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        except Exception:
+            # The reserved nonce may not have been used; re-sync on the next send
+            nonces.reset()
+            raise
         self.logger.info(f"CCIP transaction sent. Tx Hash: {tx_hash.hex()}")
         return tx_hash
 
-    async def _get_message_id(self, tx_hash: bytes) -> str:
+    async def _get_message_id(self, chain_id: int, tx_hash: bytes) -> Optional[str]:
         """
         Retrieve the CCIP message ID after transaction execution.
         
-        Placeholder: Implement with event filtering or contract call.
+        Waits for the send transaction's receipt and reads the message id from
+        the OnRamp's CCIPSendRequested log, so it returns as soon as the
+        transaction is mined. Returns None if the receipt has no such log.
         """
-        await asyncio.sleep(1)  # Simulate waiting for event emission.
-        return "dummy_message_id"
+        receipt = await self.w3_providers[chain_id].eth.wait_for_transaction_receipt(
+            tx_hash, timeout=self.config.get('CCIP_RECEIPT_TIMEOUT', CCIP_RECEIPT_TIMEOUT)
+        )
+        for log in receipt['logs']:
+            if log['topics'] and log['topics'][0] == CCIP_SEND_REQUESTED_TOPIC:
+                message, = decode([EVM2EVM_MESSAGE_TYPE], bytes(log['data']))
+                return '0x' + message[-1].hex()
+        self.logger.warning(f"No CCIPSendRequested event in receipt of {tx_hash.hex()}")
+        return None
 
 # -----------------------------
 # End of EnhancedCrossChainExecutor Module
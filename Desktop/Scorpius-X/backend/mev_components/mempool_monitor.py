@@ -1,13 +1,17 @@
 # mempool_monitor.py
 
 import asyncio
+import itertools
 import time
 import json
 import logging
+import aiohttp
+import numpy as np
+import orjson
 import redis.asyncio as redis
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
-from web3 import Web3, exceptions as w3_exceptions
+from web3 import exceptions as w3_exceptions
 
 # Placeholder for REVM Simulator
 class REVMSimulator:
@@ -65,6 +69,164 @@ class TransactionMetadata:
          if self.protocols is None:
               self.protocols = []
 
+# Seconds a simulation result stays in the Redis cache
+SIM_CACHE_TTL = 300
+
+def _dump_sim_result(sim_result: dict) -> bytes:
+    try:
+        return orjson.dumps(sim_result)
+    except orjson.JSONEncodeError:
+        # orjson only encodes 64-bit integers; raw wei amounts may not fit. They
+        # are read back as floats, which is all feature extraction needs
+        return json.dumps(sim_result).encode()
+
+# Features _extract_features can compute, in the order it lays them out;
+# ML_FEATURE_KEYS picks the model's inputs from these by name
+FEATURE_NAMES = (
+    'gas_price_gwei', 'priority_fee_gwei', 'value_eth', 'input_data_len',
+    'sim_success', 'sim_profit', 'sim_gas_used', 'sim_gas_used_normalized',
+    'sim_pool_impact', 'sim_slippage', 'sim_protocols_count',
+)
+_FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+# Pending txs priced below this (gasPrice, else maxFeePerGas) are skipped
+MIN_GAS_PRICE_WEI = 1_000_000_000
+
+# Most pending-tx hashes taken off the subscription feed per processing batch;
+# also the size of the eth_getTransactionByHash batch, so it must stay under
+# the node's batch limit (geth: 1000; hosted nodes often much lower).
+# Overridable per chain with the PENDING_TX_BATCH_SIZE config key.
+PENDING_TX_BATCH_SIZE = 512
+
+# Seconds to wait for a JSON-RPC reply over the WebSocket before treating the
+# connection as broken. Overridable with the RPC_REQUEST_TIMEOUT config key.
+RPC_REQUEST_TIMEOUT_SECONDS = 30.0
+
+# Transaction fields returned as hex quantities by eth_getTransactionByHash
+RPC_TX_QUANTITY_FIELDS = ('value', 'gasPrice', 'maxFeePerGas', 'maxPriorityFeePerGas', 'gas', 'nonce')
+
+class JsonRpcWebSocket:
+    """
+    Minimal JSON-RPC client over one persistent aiohttp WebSocket.
+
+    A reader task routes each response to the request awaiting its id and
+    queues eth_subscription notifications, so the subscription feed and the
+    transaction lookups share the connection without a thread hop per call.
+    """
+    def __init__(self, ws: aiohttp.ClientWebSocketResponse, timeout: float = RPC_REQUEST_TIMEOUT_SECONDS):
+        self._ws = ws
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        # Ids of requests sent as part of a batch that is still in flight
+        self._batch_ids: Set[int] = set()
+        # None marks the connection as closed
+        self._notifications: asyncio.Queue = asyncio.Queue()
+        self._reader = asyncio.create_task(self._read())
+
+    async def _read(self):
+        try:
+            async for msg in self._ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    self._dispatch(orjson.loads(msg.data))
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    break
+        finally:
+            closed = w3_exceptions.ProviderConnectionError("WebSocket connection closed")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(closed)
+            self._pending.clear()
+            self._notifications.put_nowait(None)
+
+    def _dispatch(self, payload):
+        if isinstance(payload, list):
+            # Batch response: one entry per request, matched by id like any other
+            for item in payload:
+                self._dispatch(item)
+            return
+        if payload.get('method') == 'eth_subscription':
+            self._notifications.put_nowait(payload['params']['result'])
+            return
+        request_id = payload.get('id')
+        if request_id is None and 'error' in payload:
+            # Rejected without an id (e.g. batch too large): no reply can be
+            # matched, so fail every batched request still waiting on one
+            failure = ValueError(payload['error'])
+            for batch_id in self._batch_ids:
+                future = self._pending.get(batch_id)
+                if future is not None and not future.done():
+                    future.set_exception(failure)
+            return
+        future = self._pending.pop(request_id, None)
+        if future is None or future.done():
+            return
+        if 'error' in payload:
+            # Same exception type web3 raises for JSON-RPC errors
+            future.set_exception(ValueError(payload['error']))
+        else:
+            future.set_result(payload.get('result'))
+
+    async def request(self, method: str, params: list):
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._ws.send_str(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+            return await asyncio.wait_for(future, self._timeout)
+        except asyncio.TimeoutError:
+            # The heartbeat keeps a stalled socket open, so surface it as a dropped connection
+            raise w3_exceptions.ProviderConnectionError(f"No reply to {method} within {self._timeout}s") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def batch_request(self, method: str, params_list: List[list]) -> list:
+        """
+        Send one JSON-RPC batch of `method` calls in a single frame.
+
+        Returns results in input order; a failed call's entry is its exception.
+        An error reply for the batch as a whole is raised.
+        """
+        loop = asyncio.get_running_loop()
+        request_ids = [next(self._ids) for _ in params_list]
+        futures = [loop.create_future() for _ in request_ids]
+        self._pending.update(zip(request_ids, futures))
+        self._batch_ids.update(request_ids)
+        try:
+            await self._ws.send_str(json.dumps([
+                {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+                for request_id, params in zip(request_ids, params_list)
+            ]))
+            results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), self._timeout)
+        except asyncio.TimeoutError:
+            raise w3_exceptions.ProviderConnectionError(
+                f"No reply to {len(request_ids)}-call {method} batch within {self._timeout}s"
+            ) from None
+        finally:
+            self._batch_ids.difference_update(request_ids)
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+        # _dispatch fails the whole batch with one shared exception
+        if results and isinstance(results[0], Exception) and all(result is results[0] for result in results):
+            raise results[0]
+        return results
+
+    async def next_notifications(self, max_items: int) -> list:
+        """
+        Wait for at least one subscription notification, then return it with
+        any others already received, up to max_items.
+        """
+        items = [await self._notifications.get()]
+        while len(items) < max_items and not self._notifications.empty():
+            items.append(self._notifications.get_nowait())
+        if None in items:
+            raise w3_exceptions.ProviderConnectionError("WebSocket connection closed")
+        return items
+
+    async def close(self):
+        self._reader.cancel()
+        await self._ws.close()
+
 class ProductionMempoolMonitor:
     def __init__(self, monitor_config, ml_model, event_bus):
         self.config = monitor_config
@@ -77,23 +239,9 @@ class ProductionMempoolMonitor:
         if not self.rpc_endpoints:
              self.logger.critical(f"No RPC_ENDPOINTS provided for chain {self.chain_name}.")
              raise ValueError(f"Missing RPC endpoints for {self.chain_name}")
-        self.w3_providers: List[Web3] = []
-        for i, url in enumerate(self.rpc_endpoints):
-             try:
-                  if url.startswith('ws'):
-                       provider = Web3(Web3.WebsocketProvider(url, websocket_timeout=60))
-                  else:
-                       provider = Web3(Web3.HTTPProvider(url))
-                  if provider.isConnected():
-                       self.w3_providers.append(provider)
-                       self.logger.info(f"Connected to RPC provider {i}: {url}")
-                  else:
-                       self.logger.error(f"Failed to connect to RPC provider {i}: {url}")
-             except Exception as e:
-                  self.logger.error(f"Error initializing RPC provider {i} ({url}): {e}", exc_info=True)
-        if not self.w3_providers:
-             self.logger.critical(f"No valid Web3 providers connected for {self.chain_name}.")
-             raise ConnectionError(f"Failed to connect any RPC providers for {self.chain_name}.")
+        # Connections are opened by start(), over one aiohttp session
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stream_tasks: List[asyncio.Task] = []
         self.bitquery = self._init_bitquery_client(self.config.get('BITQUERY_KEY'))
         self.redis_processed_key = f"processed_txs:{self.chain_id}"
         self.redis_sim_cache_key_prefix = f"sim_cache:{self.chain_id}:"
@@ -101,7 +249,7 @@ class ProductionMempoolMonitor:
         try:
             redis_cfg = self.config.get('REDIS_CONFIG', {})
             if redis_cfg and redis_cfg.get('host'):
-                 self.redis_client = redis.Redis(**redis_cfg, decode_responses=True)
+                 self.redis_client = redis.Redis(**redis_cfg, decode_responses=False)
                  self.logger.info(f"Redis client initialized for caching: {redis_cfg['host']}:{redis_cfg.get('port', 6379)}")
             else:
                  self.logger.warning("Redis config not found. Simulation caching disabled.")
@@ -115,6 +263,13 @@ class ProductionMempoolMonitor:
         self.simulation_engine = REVMSimulator(sim_rpc)
         self.min_profit_threshold = self.config.get('MIN_PROFIT_THRESHOLD', 0.1)
         self.monitored_protocols = self.config.get('MONITORED_PROTOCOLS', [])
+        self.pending_tx_batch_size = int(self.config.get('PENDING_TX_BATCH_SIZE', PENDING_TX_BATCH_SIZE))
+        self.rpc_request_timeout = float(self.config.get('RPC_REQUEST_TIMEOUT', RPC_REQUEST_TIMEOUT_SECONDS))
+        # Feature keys resolved to positions once; unknown keys read a constant 0.0
+        feature_keys = self.config.get('ML_FEATURE_KEYS', ['sim_profit', 'sim_gas_used_normalized'])
+        self._feature_indices = np.array(
+            [_FEATURE_INDEX.get(k, len(FEATURE_NAMES)) for k in feature_keys], dtype=np.intp
+        )
         self._running = False
 
     def _init_bitquery_client(self, api_key):
@@ -134,10 +289,11 @@ class ProductionMempoolMonitor:
              return
         self._running = True
         self.logger.info(f"Starting monitor streams for {self.chain_name}...")
+        self._session = aiohttp.ClientSession()
         tasks = []
-        for i, w3 in enumerate(self.w3_providers):
-             if isinstance(w3.provider, Web3.WebsocketProvider):
-                  tasks.append(asyncio.create_task(self._stream_local_websocket(w3, f"local_ws_{i}")))
+        for i, url in enumerate(self.rpc_endpoints):
+             if url.startswith('ws'):
+                  tasks.append(asyncio.create_task(self._stream_local_websocket(url, f"local_ws_{i}")))
              else:
                    self.logger.warning(f"RPC provider {i} is HTTP. Subscription not available.")
         if self.bitquery:
@@ -145,7 +301,9 @@ class ProductionMempoolMonitor:
         if not tasks:
              self.logger.error("No monitoring streams could be started.")
              self._running = False
+             await self._session.close()
              return
+        self._stream_tasks = tasks
         self.logger.info(f"Started {len(tasks)} monitoring stream tasks.")
         try:
             await asyncio.gather(*tasks)
@@ -153,26 +311,33 @@ class ProductionMempoolMonitor:
              self.logger.info("Monitor tasks cancelled.")
         finally:
              self._running = False
+             self._stream_tasks = []
+             await self._session.close()
              self.logger.info(f"Monitor stopped for {self.chain_name}.")
 
     async def stop(self):
          self.logger.info(f"Received stop signal for {self.chain_name}.")
          self._running = False
+         # Streams block on the next pushed tx, so cancel rather than wait for one
+         for task in self._stream_tasks:
+              task.cancel()
 
-    async def _stream_local_websocket(self, w3: Web3, source_id: str):
+    async def _stream_local_websocket(self, ws_url: str, source_id: str):
          while self._running:
-              subscription_id = None
+              rpc = None
               try:
                    self.logger.info(f"Subscribing to newPendingTransactions via {source_id}...")
-                   subscription_id = await asyncio.to_thread(w3.eth.subscribe, 'newPendingTransactions')
+                   rpc = JsonRpcWebSocket(
+                        await self._session.ws_connect(ws_url, heartbeat=30), timeout=self.rpc_request_timeout
+                   )
+                   subscription_id = await rpc.request('eth_subscribe', ['newPendingTransactions'])
                    self.logger.info(f"Subscribed with ID: {subscription_id} on {source_id}")
                    while self._running:
-                        new_tx_hashes = await asyncio.to_thread(w3.eth.get_filter_changes, subscription_id)
-                        if new_tx_hashes:
-                             process_tasks = [self._fetch_and_process_tx(w3, tx_hash, source_id) for tx_hash in new_tx_hashes]
-                             await asyncio.gather(*process_tasks)
-                        await asyncio.sleep(0.5)
-              except (w3_exceptions.ProviderConnectionError, asyncio.TimeoutError) as e:
+                        # Hashes are pushed by the node; whatever arrived while the
+                        # previous batch was processed makes up the next one
+                        new_tx_hashes = await rpc.next_notifications(self.pending_tx_batch_size)
+                        await self._process_batch(rpc, new_tx_hashes, source_id)
+              except (w3_exceptions.ProviderConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as e:
                    self.logger.error(f"Connection error on {source_id}: {e}. Reconnecting in 10s...")
                    await asyncio.sleep(10)
               except asyncio.CancelledError:
@@ -183,31 +348,102 @@ class ProductionMempoolMonitor:
                    self.event_bus.publish("monitor_error", {"chain": self.chain_name, "source": source_id, "error": str(e)})
                    await asyncio.sleep(5)
               finally:
-                 if subscription_id:
+                 if rpc:
+                     # The node drops the subscription along with the connection
                      try:
-                         await asyncio.to_thread(w3.eth.unsubscribe, subscription_id)
-                         self.logger.info(f"Unsubscribed from {subscription_id} on {source_id}")
-                     except Exception as unsub_e:
-                         self.logger.warning(f"Failed to unsubscribe from {subscription_id} on {source_id}: {unsub_e}")
+                         await rpc.close()
+                         self.logger.info(f"Closed subscription connection on {source_id}")
+                     except Exception as close_e:
+                         self.logger.warning(f"Failed to close subscription connection on {source_id}: {close_e}")
                  if self._running:
                       await asyncio.sleep(1)
          self.logger.info(f"Local websocket stream {source_id} stopped.")
 
-    async def _fetch_and_process_tx(self, w3: Web3, tx_hash, source_id: str):
+    async def _claim_new_hashes(self, tx_hashes) -> list:
+        # One pipelined SADD per batch instead of a SISMEMBER and an SADD per tx;
+        # SADD returns 0 for hashes already in the set, which are dropped
+        if not self.redis_client:
+            return list(tx_hashes)
         try:
-            if self.redis_client and await self.redis_client.sismember(self.redis_processed_key, tx_hash.hex()):
-                return
-            tx_data = await asyncio.to_thread(w3.eth.get_transaction, tx_hash)
-            if tx_data:
-                await self._process_transaction(tx_data, source=source_id)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for tx_hash in tx_hashes:
+                    pipe.sadd(self.redis_processed_key, tx_hash)
+                added = await pipe.execute()
+        except Exception as redis_e:
+            self.logger.error(f"Redis pipeline error for batch of {len(tx_hashes)} txs: {redis_e}")
+            return list(tx_hashes)
+        return [tx_hash for tx_hash, is_new in zip(tx_hashes, added) if is_new]
+
+    async def _process_batch(self, rpc: JsonRpcWebSocket, tx_hashes, source_id: str):
+        """
+        Process one batch of pending-tx hashes: dedupe, fetch, quick-filter,
+        then simulate the survivors together so cache lookups and writes cost
+        one Redis round-trip each for the whole batch.
+        """
+        tx_hashes = await self._claim_new_hashes(tx_hashes)
+        if not tx_hashes:
+            return
+        fetched = [tx_data for tx_data in await self._batch_get_transactions(rpc, tx_hashes, source_id) if tx_data]
+        if not fetched:
+            return
+        # Quick filter over the whole batch at once, as one mask on per-field arrays
+        columns = self._unpack_batch(fetched)
+        keep = np.flatnonzero((columns['gas_prices'] >= MIN_GAS_PRICE_WEI) & columns['to_present'])
+        self.logger.debug(f"{len(fetched) - len(keep)} of {len(fetched)} txs from {source_id} failed quick filter.")
+        if not len(keep):
+            return
+        candidates = [fetched[i] for i in keep]
+        columns = {field: column[keep] for field, column in columns.items()}
+        simulation_results = await self._simulate_batch(candidates)
+        simulated = [i for i, sim in enumerate(simulation_results) if sim and sim.get('success')]
+        self.logger.debug(f"{len(candidates) - len(simulated)} of {len(candidates)} simulations from {source_id} failed.")
+        if not simulated:
+            return
+        candidates = [candidates[i] for i in simulated]
+        simulation_results = [simulation_results[i] for i in simulated]
+        columns = {field: column[simulated] for field, column in columns.items()}
+        scores = self._score_batch(self._extract_features_batch(columns, simulation_results), simulation_results)
+        profitable = np.flatnonzero(scores > self.min_profit_threshold)
+        self.logger.debug(f"{len(profitable)} of {len(candidates)} simulated txs from {source_id} above profit threshold.")
+        for i in profitable:
+            tx_data = candidates[i]
+            try:
+                self._publish_opportunity(tx_data, self._extract_tx_hash(tx_data), source_id, simulation_results[i], float(scores[i]))
+            except Exception as e:
+                self.logger.error(f"Error publishing tx {self._extract_tx_hash(tx_data)} from {source_id}: {e}", exc_info=True)
+
+    async def _batch_get_transactions(self, rpc: JsonRpcWebSocket, tx_hashes: List[str], source_id: str) -> list:
+        """
+        Fetch a batch of transactions with one JSON-RPC batch request.
+
+        Returns normalized tx dicts in input order, with None for any the node
+        could not return.
+        """
+        results = await rpc.batch_request('eth_getTransactionByHash', [[tx_hash] for tx_hash in tx_hashes])
+        txs = []
+        for tx_hash, tx_data in zip(tx_hashes, results):
+            if isinstance(tx_data, w3_exceptions.ProviderConnectionError):
+                # Let the stream reconnect rather than log every hash in the batch
+                raise tx_data
+            if isinstance(tx_data, Exception):
+                self.logger.error(f"Error fetching tx {tx_hash} from {source_id}: {tx_data}")
+                txs.append(None)
+            elif not tx_data:
+                # Dropped or replaced before we asked for it
+                self.logger.debug(f"Transaction {tx_hash} not found on {source_id}.")
+                txs.append(None)
             else:
-                self.logger.warning(f"Could not retrieve tx details for {tx_hash.hex()} from {source_id}")
-        except w3_exceptions.TransactionNotFound:
-            self.logger.debug(f"Transaction {tx_hash.hex()} not found on {source_id}.")
-        except asyncio.CancelledError:
-             raise
-        except Exception as e:
-            self.logger.error(f"Error fetching/processing tx {tx_hash.hex()} from {source_id}: {e}", exc_info=True)
+                txs.append(self._normalize_rpc_tx(tx_data))
+        return txs
+
+    @staticmethod
+    def _normalize_rpc_tx(tx: dict) -> dict:
+        # Raw JSON-RPC results carry quantities as hex strings; the extractors expect ints
+        for field in RPC_TX_QUANTITY_FIELDS:
+            value = tx.get(field)
+            if isinstance(value, str):
+                tx[field] = int(value, 16)
+        return tx
 
     async def _stream_bitquery_mempool(self):
           if not self.bitquery: return
@@ -262,42 +498,55 @@ class ProductionMempoolMonitor:
             self.logger.debug(f"Tx {tx_hash[:10]}... failed quick filter.")
             return
         simulation_result = await self._simulate_transaction(tx_data)
+        self._evaluate_transaction(tx_data, tx_hash, source, simulation_result)
+
+    def _evaluate_transaction(self, tx_data, tx_hash: str, source, simulation_result):
         if not simulation_result or not simulation_result.get('success'):
              self.logger.debug(f"Tx {tx_hash[:10]}... simulation failed.")
              return
-        features = self._extract_features(tx_data, simulation_result)
-        profit_score = 0.0
-        if self.ml_model:
-            try:
-                profit_score = self.ml_model.predict(features)
-                self.logger.debug(f"Tx {tx_hash[:10]}... ML score: {profit_score:.4f}")
-            except Exception as ml_e:
-                self.logger.error(f"ML prediction failed for {tx_hash[:10]}: {ml_e}")
-                profit_score = simulation_result.get('profit', 0)
-        else:
-             profit_score = simulation_result.get('profit', 0)
-             self.logger.debug(f"Tx {tx_hash[:10]}... using simulation profit: {profit_score:.4f}")
+        # Scored as a one-row batch so ml_model.predict has a single contract
+        profit_score = float(self._score_batch(self._extract_features(tx_data, simulation_result), [simulation_result])[0])
+        self.logger.debug(f"Tx {tx_hash[:10]}... profit score: {profit_score:.4f}")
         if profit_score > self.min_profit_threshold:
-            self.logger.info(f"*** Opportunity Detected! *** Tx: {tx_hash[:10]}..., Source: {source}, Est. Profit: {profit_score:.6f} ETH")
-            metadata = TransactionMetadata(
-                tx_hash=tx_hash,
-                sender=self._extract_sender(tx_data),
-                to=self._extract_receiver(tx_data),
-                gas_price=self._extract_gas_price(tx_data),
-                max_fee_per_gas=self._extract_max_fee(tx_data),
-                max_priority_fee_per_gas=self._extract_priority_fee(tx_data),
-                value_wei=self._extract_value(tx_data),
-                input_data=self._extract_input_data(tx_data),
-                timestamp=time.time(),
-                source=source,
-                protocols=self._identify_protocols(tx_data, simulation_result),
-                simulation_result=simulation_result,
-                estimated_profit=profit_score
-            )
-            self.event_bus.publish("opportunity_detected", metadata)
+            self._publish_opportunity(tx_data, tx_hash, source, simulation_result, profit_score)
         else:
             self.logger.debug(f"Tx {tx_hash[:10]}... profit score {profit_score:.4f} below threshold.")
 
+    def _score_batch(self, features: np.ndarray, simulation_results) -> np.ndarray:
+        """
+        Profit scores for a batch's (N, F) feature matrix from a single
+        ml_model.predict call, which must return one score per row. Falls back
+        to the simulated profits without a model or if the call fails.
+        """
+        if self.ml_model:
+            try:
+                scores = np.asarray(self.ml_model.predict(features.astype(np.float32)), dtype=np.float64).reshape(-1)
+                if scores.size == len(features):
+                    return scores
+                self.logger.error(f"ML model returned {scores.size} scores for {len(features)} txs.")
+            except Exception as ml_e:
+                self.logger.error(f"Batched ML prediction failed for {len(features)} txs: {ml_e}")
+        return np.array([sim.get('profit', 0) for sim in simulation_results], dtype=np.float64)
+
+    def _publish_opportunity(self, tx_data, tx_hash: str, source, simulation_result, profit_score: float):
+        self.logger.info(f"*** Opportunity Detected! *** Tx: {tx_hash[:10]}..., Source: {source}, Est. Profit: {profit_score:.6f} ETH")
+        metadata = TransactionMetadata(
+            tx_hash=tx_hash,
+            sender=self._extract_sender(tx_data),
+            to=self._extract_receiver(tx_data),
+            gas_price=self._extract_gas_price(tx_data),
+            max_fee_per_gas=self._extract_max_fee(tx_data),
+            max_priority_fee_per_gas=self._extract_priority_fee(tx_data),
+            value_wei=self._extract_value(tx_data),
+            input_data=self._extract_input_data(tx_data),
+            timestamp=time.time(),
+            source=source,
+            protocols=self._identify_protocols(tx_data, simulation_result),
+            simulation_result=simulation_result,
+            estimated_profit=profit_score
+        )
+        self.event_bus.publish("opportunity_detected", metadata)
+
     async def _simulate_transaction(self, tx_data):
         tx_hash = self._extract_tx_hash(tx_data)
         cache_key = f"{self.redis_sim_cache_key_prefix}{tx_hash}"
@@ -306,10 +555,53 @@ class ProductionMempoolMonitor:
                 cached_result = await self.redis_client.get(cache_key)
                 if cached_result:
                     self.logger.debug(f"Simulation cache HIT for tx {tx_hash[:10]}...")
-                    return json.loads(cached_result)
+                    return orjson.loads(cached_result)
             except Exception as redis_e:
                  self.logger.error(f"Redis GET error for {cache_key}: {redis_e}")
         self.logger.debug(f"Simulation cache MISS for tx {tx_hash[:10]}... Running simulation.")
+        sim_result = await self._run_simulation(tx_data, tx_hash)
+        if self.redis_client and sim_result:
+            try:
+                await self.redis_client.setex(cache_key, SIM_CACHE_TTL, _dump_sim_result(sim_result))
+            except Exception as redis_e:
+                self.logger.error(f"Redis SETEX error for {cache_key}: {redis_e}")
+        return sim_result
+
+    async def _simulate_batch(self, tx_list) -> list:
+        """
+        Simulate a batch of transactions, returning results in input order.
+
+        Cached results come from a single MGET; the misses are simulated
+        concurrently and written back in one pipeline.
+        """
+        tx_hashes = [self._extract_tx_hash(tx) for tx in tx_list]
+        cache_keys = [f"{self.redis_sim_cache_key_prefix}{tx_hash}" for tx_hash in tx_hashes]
+        results = [None] * len(tx_list)
+        if self.redis_client:
+            try:
+                for i, cached_result in enumerate(await self.redis_client.mget(cache_keys)):
+                    if cached_result:
+                        results[i] = orjson.loads(cached_result)
+            except Exception as redis_e:
+                self.logger.error(f"Redis MGET error for batch of {len(cache_keys)} sim results: {redis_e}")
+        misses = [i for i, result in enumerate(results) if result is None]
+        self.logger.debug(f"Simulation cache: {len(tx_list) - len(misses)} hits, {len(misses)} misses.")
+        sim_results = await asyncio.gather(*[self._run_simulation(tx_list[i], tx_hashes[i]) for i in misses])
+        for i, sim_result in zip(misses, sim_results):
+            results[i] = sim_result
+        if self.redis_client:
+            new_results = [(cache_keys[i], results[i]) for i in misses if results[i]]
+            if new_results:
+                try:
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        for cache_key, sim_result in new_results:
+                            pipe.setex(cache_key, SIM_CACHE_TTL, _dump_sim_result(sim_result))
+                        await pipe.execute()
+                except Exception as redis_e:
+                    self.logger.error(f"Redis SETEX pipeline error for {len(new_results)} sim results: {redis_e}")
+        return results
+
+    async def _run_simulation(self, tx_data, tx_hash: str):
         try:
             params = {
                  'sender': self._extract_sender(tx_data),
@@ -318,13 +610,7 @@ class ProductionMempoolMonitor:
                  'data': self._extract_input_data(tx_data)
             }
             sim_params = {k: v for k, v in params.items() if v is not None}
-            sim_result = await self.simulation_engine.simulate(**sim_params)
-            if self.redis_client and sim_result:
-                try:
-                    await self.redis_client.setex(cache_key, 300, json.dumps(sim_result))
-                except Exception as redis_e:
-                    self.logger.error(f"Redis SETEX error for {cache_key}: {redis_e}")
-            return sim_result
+            return await self.simulation_engine.simulate(**sim_params)
         except asyncio.CancelledError:
               raise
         except Exception as e:
@@ -334,12 +620,13 @@ class ProductionMempoolMonitor:
 
     def _extract_tx_hash(self, tx) -> Optional[str]:
           tx_hash_obj = tx.get('hash') or tx.get('txHash')
+          if isinstance(tx_hash_obj, str):
+               return tx_hash_obj
           return tx_hash_obj.hex() if tx_hash_obj else None
 
     def _quick_filter(self, tx) -> bool:
-        min_gas = 1_000_000_000
         gas_price = self._extract_gas_price(tx) or self._extract_max_fee(tx) or 0
-        if gas_price < min_gas:
+        if gas_price < MIN_GAS_PRICE_WEI:
             return False
         if not self._extract_receiver(tx):
              return False
@@ -374,19 +661,40 @@ class ProductionMempoolMonitor:
         identified = [p for p in protocols if p in self.monitored_protocols]
         return identified
 
+    def _unpack_batch(self, tx_list) -> Dict[str, np.ndarray]:
+         """Unpack a list of tx dicts into per-field arrays, one row per tx."""
+         n = len(tx_list)
+         return {
+              'gas_prices': np.fromiter(
+                   ((self._extract_gas_price(tx) or self._extract_max_fee(tx) or 0) for tx in tx_list), np.float64, n),
+              'priority_fees': np.fromiter(((self._extract_priority_fee(tx) or 0) for tx in tx_list), np.float64, n),
+              'values': np.fromiter((self._extract_value(tx) or 0 for tx in tx_list), np.float64, n),
+              'input_lens': np.fromiter((len(self._extract_input_data(tx)) // 2 - 1 for tx in tx_list), np.int64, n),
+              'to_present': np.fromiter((bool(self._extract_receiver(tx)) for tx in tx_list), np.bool_, n),
+         }
+
+    def _extract_features_batch(self, columns: Dict[str, np.ndarray], simulation_results) -> np.ndarray:
+         """
+         Compute the ML feature matrix for a batch: one row per tx, one column
+         per ML_FEATURE_KEYS entry. `columns` comes from _unpack_batch.
+         """
+         # Every FEATURE_NAMES column plus a trailing zero one for unknown keys
+         table = np.zeros((len(simulation_results), len(FEATURE_NAMES) + 1))
+         table[:, _FEATURE_INDEX['gas_price_gwei']] = columns['gas_prices'] / 1e9
+         table[:, _FEATURE_INDEX['priority_fee_gwei']] = columns['priority_fees'] / 1e9
+         table[:, _FEATURE_INDEX['value_eth']] = columns['values'] / 1e18
+         table[:, _FEATURE_INDEX['input_data_len']] = columns['input_lens']
+         sim_columns = np.array([
+              (1.0 if sim.get('success') else 0.0, sim.get('profit', 0), sim.get('gas_used', 0),
+               sim.get('pool_impact', 0), sim.get('slippage', 0), len(sim.get('protocols', [])))
+              for sim in simulation_results
+         ], dtype=np.float64).reshape(-1, 6)
+         for j, name in enumerate(('sim_success', 'sim_profit', 'sim_gas_used',
+                                   'sim_pool_impact', 'sim_slippage', 'sim_protocols_count')):
+              table[:, _FEATURE_INDEX[name]] = sim_columns[:, j]
+         table[:, _FEATURE_INDEX['sim_gas_used_normalized']] = sim_columns[:, 2] / 300000.0
+         return table[:, self._feature_indices]
+
     def _extract_features(self, tx, simulation_result):
-         features = {}
-         features['gas_price_gwei'] = (self._extract_gas_price(tx) or self._extract_max_fee(tx) or 0) / 1e9
-         features['priority_fee_gwei'] = (self._extract_priority_fee(tx) or 0) / 1e9
-         features['value_eth'] = self._extract_value(tx) / 1e18
-         features['input_data_len'] = len(self._extract_input_data(tx)) // 2 - 1
-         features['sim_success'] = 1.0 if simulation_result.get('success') else 0.0
-         features['sim_profit'] = simulation_result.get('profit', 0)
-         features['sim_gas_used'] = simulation_result.get('gas_used', 0)
-         features['sim_gas_used_normalized'] = features.get('sim_gas_used', 0) / 300000.0
-         features['sim_pool_impact'] = simulation_result.get('pool_impact', 0)
-         features['sim_slippage'] = simulation_result.get('slippage', 0)
-         features['sim_protocols_count'] = len(simulation_result.get('protocols', []))
-         expected_feature_keys = self.config.get('ML_FEATURE_KEYS', ['sim_profit', 'sim_gas_used_normalized'])
-         feature_vector = [features.get(k, 0.0) for k in expected_feature_keys]
-         return feature_vector
+         """Feature matrix (1, F) for a single tx."""
+         return self._extract_features_batch(self._unpack_batch([tx]), [simulation_result])
@@ -0,0 +1,55 @@
+# tx_cache.py
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+GAS_PRICE_TTL = 3.0  # seconds a fetched gas price stays valid
+
+class NonceManager:
+    """
+    Hands out transaction nonces for one (chain, account) pair locally.
+
+    The pending nonce is fetched from the node on first use; every reserve()
+    after that increments it without an RPC round-trip. Call reset() when a
+    send fails so the next reservation re-syncs with the node.
+    """
+    def __init__(self, fetch_nonce: Callable[[], Awaitable[int]]):
+        self._fetch_nonce = fetch_nonce
+        self._next: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def reserve(self) -> int:
+        async with self._lock:
+            if self._next is None:
+                self._next = await self._fetch_nonce()
+            nonce = self._next
+            self._next += 1
+            return nonce
+
+    def reset(self):
+        self._next = None
+
+class GasPriceCache:
+    """
+    Caches a chain's gas price for `ttl` seconds.
+
+    Concurrent callers that find the value stale share a single refresh.
+    """
+    def __init__(self, fetch_gas_price: Callable[[], Awaitable[int]], ttl: float = GAS_PRICE_TTL):
+        self._fetch_gas_price = fetch_gas_price
+        self._ttl = ttl
+        self._value: Optional[int] = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._value is not None and time.monotonic() - self._fetched_at < self._ttl
+
+    async def get(self) -> int:
+        if self._is_fresh():
+            return self._value
+        async with self._lock:
+            if not self._is_fresh():
+                self._value = await self._fetch_gas_price()
+                self._fetched_at = time.monotonic()
+            return self._value
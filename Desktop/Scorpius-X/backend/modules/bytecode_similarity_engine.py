@@ -472,3 +472,39 @@ async def analyze_contract_bytecode(
         engine = BytecodeSimilarityEngine()
     
     return await engine.analyze_bytecode_similarity(bytecode)
+
+
+# Per-process engine reused by analyze_bytecode_sync in pool workers
+_process_engine: Optional[BytecodeSimilarityEngine] = None
+
+
+def analyze_bytecode_sync(
+    bytecode: str,
+    include_opcode_analysis: bool = True,
+    include_vulnerability_patterns: bool = True,
+    include_fingerprinting: bool = True
+) -> Dict[str, Any]:
+    """
+    Synchronous, picklable entry point for running the analysis in a
+    process pool. Similarity diffing is pure-Python CPU work, so worker
+    processes are what lets several contracts be analyzed in parallel.
+    
+    Args:
+        bytecode: Contract bytecode (hex string, with or without 0x prefix)
+        include_opcode_analysis: Whether to include opcode-level analysis
+        include_vulnerability_patterns: Whether to check for vulnerability patterns
+        include_fingerprinting: Whether to generate bytecode fingerprints
+        
+    Returns:
+        Dictionary containing all analysis results
+    """
+    global _process_engine
+    if _process_engine is None:
+        _process_engine = BytecodeSimilarityEngine()
+    
+    return asyncio.run(_process_engine.analyze_bytecode_similarity(
+        bytecode=bytecode,
+        include_opcode_analysis=include_opcode_analysis,
+        include_vulnerability_patterns=include_vulnerability_patterns,
+        include_fingerprinting=include_fingerprinting
+    ))
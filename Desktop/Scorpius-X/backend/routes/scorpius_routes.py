@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
@@ -18,7 +18,7 @@ from models.scorpius_models import (
     ScorpiusScan, ScanStatus, ScanType, VulnerabilityLevel,
     ScanRequest, ScanResponse, ScanProgress
 )
-from core.scorpius.report_generator import ReportGenerator
+from core.scorpius.report_generator import ReportGenerator, gzip_path
 from core.scorpius.vulnerability_scanner import ScorpiusVulnerabilityScanner
 from core.db import get_db
 import os
@@ -206,6 +206,7 @@ async def get_scan_results(
 async def download_report(
     scan_id: str,
     report_type: str,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -250,6 +251,17 @@ async def download_report(
         
         filename = f"scorpius_scan_{scan_id}.{report_type}"
         
+        # Serve the precompressed HTML when the client accepts gzip
+        if report_type == "html" and "gzip" in request.headers.get("accept-encoding", ""):
+            compressed_path = gzip_path(Path(report_path))
+            if compressed_path.exists():
+                return FileResponse(
+                    path=compressed_path,
+                    media_type=media_types[report_type],
+                    filename=filename,
+                    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+                )
+        
         return FileResponse(
             path=report_path,
             media_type=media_types[report_type],
@@ -434,7 +446,10 @@ async def delete_scan(
         
         # Delete report files if requested
         if delete_reports:
-            for report_path in [scan.report_html_path, scan.report_pdf_path, scan.report_json_path]:
+            report_paths = [scan.report_html_path, scan.report_pdf_path, scan.report_json_path]
+            if scan.report_html_path:
+                report_paths.append(str(gzip_path(Path(scan.report_html_path))))
+            for report_path in report_paths:
                 if report_path and Path(report_path).exists():
                     try:
                         Path(report_path).unlink()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI analyzer's prompt helpers (source compression, cache keys)
+"""
+
+import os
+import sys
+
+# Add the backend and scorpius core directories to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "core", "scorpius"))
+
+import json
+
+from ai_analyzer import SOURCE_TOKEN_BUDGET, ClaudeAnalyzer, compress_source, format_vulnerability_context
+
+
+def _contract(header: str, functions: int, body_lines: int) -> str:
+    """Build a contract with the given leading comment and padded functions"""
+    parts = [f"pragma solidity ^0.8.0;\n\n{header}\ncontract Vault {{\n    address owner;\n\n"]
+    for i in range(functions):
+        body = "".join(f"        balances[msg.sender] += {j};\n" for j in range(body_lines))
+        risky = '        (bool ok, ) = msg.sender.call{value: 1}("");\n' if i % 7 == 0 else ""
+        parts.append(f"    function f{i}(uint256 amount) external {{\n{body}{risky}    }}\n\n")
+    parts.append("}\n")
+    return "".join(parts)
+
+
+def test_compress_source_ignores_keywords_in_natspec():
+    """A comment mentioning `function` must not swallow the whole contract"""
+    src = _contract("/// @notice the main function of this contract {", 60, 25)
+    assert len(src) > 40_000
+    compressed = compress_source(src)
+    assert len(compressed) >= SOURCE_TOKEN_BUDGET * 4
+    assert "function f0(" in compressed
+    assert "contract Vault" in compressed
+
+
+def test_compress_source_ignores_braces_in_strings_and_comments():
+    """Unbalanced braces inside strings/comments don't break function spans"""
+    header = '/* { unbalanced */\nstring constant BANNER = "}}}";'
+    src = _contract(header, 60, 25)
+    compressed = compress_source(src)
+    assert "function f0(" in compressed
+    assert "lower-risk functions omitted" in compressed
+
+
+def test_compress_source_many_small_functions():
+    """Whitespace between many tiny functions is not charged against the budget"""
+    src = _contract("", 400, 0)
+    compressed = compress_source(src)
+    assert len(compressed) >= SOURCE_TOKEN_BUDGET * 4
+    # Risky functions are preferred over a plain prefix slice
+    assert "function f399(" in compressed
+
+
+def test_cache_key_accepts_integers_beyond_64_bits():
+    """Raw wei amounts overflow orjson's integer range but must still hash"""
+    context = [{"severity": "high", "value": 2 ** 70}]
+    key = ClaudeAnalyzer._cache_key("0xABC", "contract A {}", None, None, context)
+    assert key == ClaudeAnalyzer._cache_key("0xabc", "contract A {}", None, None, context)
+    assert key != ClaudeAnalyzer._cache_key("0xabc", "contract A {}", None, None, [{"severity": "high", "value": 2 ** 71}])
+
+
+def test_vulnerability_context_accepts_integers_beyond_64_bits():
+    context = [{"severity": "high", "value": 2 ** 70}]
+    assert json.loads(format_vulnerability_context(context)) == context
+    trimmed = json.loads(format_vulnerability_context(context * 50, budget_chars=500))
+    assert trimmed and trimmed[0]["value"] == 2 ** 70
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
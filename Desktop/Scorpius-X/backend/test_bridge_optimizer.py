@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for BridgeOptimizer route selection
+"""
+
+import os
+import sys
+import warnings
+
+# mev_components modules import their siblings by bare name
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "mev_components"))
+
+from bridge_optimizer import BridgeOptimizer
+
+DRY_ROUTE = {"bridge": "dry", "fee_bps": 0.0, "latency_s": 1.0, "liquidity": 0.0}
+FUNDED_ROUTE = {"bridge": "funded", "fee_bps": 5.0, "latency_s": 60.0, "liquidity": 1_000_000.0}
+
+
+def _optimize(config, amount, routes):
+    with warnings.catch_warnings():
+        # NaN/inf arithmetic must not leak RuntimeWarnings either
+        warnings.simplefilter("error")
+        return BridgeOptimizer(config).optimize({"amount": amount, "routes": routes})
+
+
+def test_zero_slippage_weight_skips_dry_route():
+    best = _optimize({"BRIDGE_SLIPPAGE_WEIGHT": 0.0}, 1000.0, [DRY_ROUTE, FUNDED_ROUTE])
+    assert best["bridge"] == "funded"
+
+
+def test_zero_amount_skips_dry_route():
+    best = _optimize({}, 0.0, [DRY_ROUTE, FUNDED_ROUTE])
+    assert best["bridge"] == "funded"
+
+
+def test_all_routes_dry_returns_none():
+    assert _optimize({}, 1000.0, [DRY_ROUTE, dict(DRY_ROUTE, bridge="dry2")]) is None
+    assert _optimize({"BRIDGE_SLIPPAGE_WEIGHT": 0.0}, 0.0, [DRY_ROUTE]) is None
+
+
+def test_prefers_cheaper_funded_route():
+    shallow = {"bridge": "shallow", "fee_bps": 1.0, "latency_s": 60.0, "liquidity": 10_000.0}
+    best = _optimize({}, 5000.0, [shallow, FUNDED_ROUTE])
+    assert best["bridge"] == "funded"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")